@@ -4,11 +4,17 @@ Supports up to 8 simultaneous windows
 """
 
 import ctypes
+import functools
+import hashlib
+import io
 import json
 import os
+import re
+import tempfile
 import threading
 import time
 import tkinter as tk
+from concurrent.futures import ThreadPoolExecutor
 from tkinter import ttk, messagebox
 from typing import Optional, Dict
 
@@ -20,12 +26,33 @@ try:
 except ImportError:
     keyboard = None
 
+# Optional fast JSON encoder for config saves (falls back to the stdlib json module)
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Optional libvips thumbnailer for cache misses in the selection window (shrinks JPEGs while decoding)
+try:
+    import pyvips
+except (ImportError, OSError):
+    pyvips = None
+
 from utils import get_resource_path, MAX_WINDOWS, DEBUG_MODE_EN, DEBUG_PRINTS
 from window_manager import WindowManager
 from fishing_bot import FishingBot
 from debug_windows import IgnoredPositionsWindow, FishDetectorDebugWindow, StatusLogWindow
 
 
+@functools.lru_cache(maxsize=1)
+def _dpi_scale() -> Optional[float]:
+    """Display scale factor (1.0 = 100%), queried from Windows once per process. None if unavailable."""
+    try:
+        return ctypes.windll.shcore.GetScaleFactorForDevice(0) / 100.0
+    except Exception:
+        return None
+
+
 class FishSelectionWindow:
     """Window for selecting fish/item actions (keep, drop, open)"""
     
@@ -37,7 +64,43 @@ class FishSelectionWindow:
         None: '#555555'       # Gray (not set)
     }
     
-    def __init__(self, parent, current_actions: dict, on_save_callback, config: dict = None, accent_color: str = "#FFBB00", rgb_wave_active: bool = False, rgb_wave_hue: int = 0):
+    # (rectangle, label) itemconfig options for a selected action button and for the others
+    _ACTIVE_STYLES = {action: ({'fill': color, 'outline': '#111111'}, {'fill': 'white'})
+                      for action, color in ACTION_COLORS.items() if action}
+    _INACTIVE_STYLE = ({'fill': '#555555', 'outline': '#888888'}, {'fill': '#aaaaaa'})
+    
+    # Action buttons: Fish get K D O, Items get K D only
+    _FISH_ACTIONS = (('keep', 'K'), ('drop', 'D'), ('open', 'O'))
+    _ITEM_ACTIONS = (('keep', 'K'), ('drop', 'D'))
+    
+    # Cleaned, truncated label per asset filename (shared across openings of the window)
+    _ASSET_SUFFIX_RE = re.compile(r'_(living|item)\.(jpg|png)$')
+    _ASSET_SUFFIX_TYPES = (('_living.jpg', 'fish'), ('_living.png', 'fish'), ('_item.jpg', 'item'), ('_item.png', 'item'))
+    _display_names = {}
+    
+    # One PhotoImage per distinct thumbnail (assets sharing the same art share the image)
+    _photos_by_content = {}
+    
+    # Resized item images are kept as small PNGs between runs, keyed by a hash of the source file's
+    # bytes (the onefile build unpacks the assets to a new temp dir with fresh mtimes every launch)
+    _THUMB_SIZE = (36, 36)
+    _THUMB_CACHE_DIR = os.path.join(tempfile.gettempdir(), "fishbot_thumb_cache")
+    _thumb_keys_used = set()  # Cache keys looked up by _load_thumbnail, see _prune_thumb_cache
+    
+    # Item cells are built a couple of rows at a time from the event loop, so the window shows
+    # up (and the first rows are usable) before every cell exists
+    _ITEMS_PER_BATCH = 14
+    
+    # Item cells are drawn as canvas items (no per-cell Frame/Label/Button widgets); sizes in pixels
+    _ITEMS_PER_ROW = 7
+    _CELL_W = 76
+    _CELL_H = 74
+    _HEADER_H = 24
+    _BTN_W = 22
+    _BTN_H = 14
+    _BTN_FONT = ("Courier New", 6, "bold")
+    
+    def __init__(self, parent, current_actions: dict, on_save_callback, config: dict = None, accent_color: str = "#FFBB00", rgb_wave_active: bool = False, rgb_wave_hue: int = 0, thumb_cache: dict = None):
         self.parent = parent
         self.current_actions = current_actions.copy()
         self.on_save_callback = on_save_callback
@@ -45,8 +108,11 @@ class FishSelectionWindow:
         self.accent_color = accent_color  # Store dynamic accent color
         self.rgb_wave_active = rgb_wave_active  # RGB wave effect state
         self.rgb_wave_hue = rgb_wave_hue  # Current hue for RGB wave
-        self.item_widgets = {}  # {filename: {'frame': frame, 'action_var': var, 'buttons': {}}}
-        self.photo_images = []  # Keep references to prevent garbage collection
+        self.item_widgets = {}  # {filename: {'buttons': {action: (rect_id, text_id)}, 'current_action': ..., 'item_type': ...}}
+        self.item_types = {}  # {filename: 'fish' | 'item'} for every asset, built or not
+        self._pending_items = []  # (filename, thumbnail, x, y, item_type) not yet drawn
+        self._button_targets = {}  # {canvas item id: (filename, action)} for the action button items
+        self.thumb_cache = thumb_cache if thumb_cache is not None else {}  # {filename: PhotoImage}, owned by the caller
         self.buttons_to_update = []  # Store button references for RGB wave updates
         
         # Create window
@@ -56,12 +122,12 @@ class FishSelectionWindow:
         # Calculate window dimensions based on DPI scaling
         base_width = 560
         base_height = 630
-        try:
-            dpi_scale = ctypes.windll.shcore.GetScaleFactorForDevice(0) / 100.0
+        dpi_scale = _dpi_scale()
+        if dpi_scale is not None:
             # Scale dimensions proportionally for high DPI
             window_width = int(base_width * max(1.0, dpi_scale * 0.89))
             window_height = int(base_height * max(1.0, dpi_scale * 0.88))
-        except Exception:
+        else:
             window_width = base_width
             window_height = base_height
         
@@ -120,6 +186,11 @@ class FishSelectionWindow:
         
         self.canvas.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
         
+        # One set of bindings for every action button item (instead of three Tcl commands per item)
+        self.canvas.tag_bind("action_button", "<Button-1>", self._on_action_button_click)
+        self.canvas.tag_bind("action_button", "<Enter>", lambda e: self.canvas.config(cursor="hand2"))
+        self.canvas.tag_bind("action_button", "<Leave>", lambda e: self.canvas.config(cursor=""))
+        
         # Bottom buttons
         button_frame = tk.Frame(self.window, bg="#1a1a1a")
         button_frame.pack(fill=tk.X, padx=5, pady=10)
@@ -172,13 +243,21 @@ class FishSelectionWindow:
                     font=("Courier New", 12)).pack(pady=20)
             return
         
-        # Get all fish and item files
-        files = []
-        for f in os.listdir(assets_path):
-            if f.endswith('_living.jpg') or f.endswith('_living.png'):
-                files.append(('fish', f))
-            elif f.endswith('_item.jpg') or f.endswith('_item.png'):
-                files.append(('item', f))
+        # Get all fish and item files, bucketed by type as they're found (scandir entries carry
+        # their full path, no join per file)
+        sections = {'fish': [], 'item': []}
+        with os.scandir(assets_path) as entries:
+            for entry in entries:
+                name = entry.name
+                for suffix, item_type in self._ASSET_SUFFIX_TYPES:
+                    if name.endswith(suffix):
+                        sections[item_type].append((name, entry.path))
+                        break
+        
+        # Sort each section by name; fish come first, then items
+        for section in sections.values():
+            section.sort()
+        files = [(item_type, name, path) for item_type in ('fish', 'item') for name, path in sections[item_type]]
         
         if not files:
             tk.Label(self.scrollable_frame, text="No fish or item images found in assets folder!",
@@ -186,98 +265,200 @@ class FishSelectionWindow:
                     font=("Courier New", 12)).pack(pady=20)
             return
         
-        # Sort: fish first, then items
-        files.sort(key=lambda x: (0 if x[0] == 'fish' else 1, x[1]))
-        
-        # Create section labels
-        current_type = None
-        row = 0
-        col = 0
-        items_per_row = 7
-        
-        for item_type, filename in files:
-            # Add section header if type changes
-            if item_type != current_type:
-                if col != 0:
-                    row += 1
-                    col = 0
-                
-                section_label = tk.Label(self.scrollable_frame, 
-                                        text=f"{'Fish' if item_type == 'fish' else 'Items'}",
-                                        font=("Courier New", 9, "bold"),
-                                        bg="#1a1a1a", fg="#FFBB00")
-                section_label.grid(row=row, column=0, columnspan=items_per_row, sticky="w", pady=(8, 2), padx=3)
-                row += 1
-                current_type = item_type
+        # Decode/resize every thumbnail in parallel (PIL releases the GIL); only the PhotoImage
+        # and widget creation below have to happen on the Tk thread
+        # (files that already have a cached PhotoImage are skipped)
+        thumbnails = [None] * len(files)
+        missing = [i for i, (_, filename, _) in enumerate(files) if filename not in self.thumb_cache]
+        if missing:
+            paths = [files[i][2] for i in missing]
+            with ThreadPoolExecutor(max_workers=min(8, os.cpu_count() or 4)) as executor:
+                for i, thumbnail in zip(missing, executor.map(self._try_load_thumbnail, paths)):
+                    thumbnails[i] = thumbnail
+            # Every asset went through the disk cache: whatever else is in it is stale
+            if len(missing) == len(files):
+                self._prune_thumb_cache()
+        
+        # Lay out one section per type: a header, then its cells row by row
+        y = 0
+        index = 0
+        for item_type in ('fish', 'item'):
+            count = len(sections[item_type])
+            if not count:
+                continue
+            
+            self.canvas.create_text(3, y + 8, text=f"{'Fish' if item_type == 'fish' else 'Items'}",
+                                    font=("Courier New", 9, "bold"), fill="#FFBB00", anchor="nw")
+            y += self._HEADER_H
             
-            # Create item frame
-            self.create_item_widget(filename, assets_path, row, col, item_type)
+            for i in range(count):
+                _, filename, _ = files[index]
+                row, col = divmod(i, self._ITEMS_PER_ROW)
+                
+                # Queue the item cell; every item gets its default action now, drawn or not
+                self.item_types[filename] = item_type
+                self.current_actions.setdefault(filename, 'keep')
+                self._pending_items.append((filename, thumbnails[index], 3 + col * self._CELL_W,
+                                            y + row * self._CELL_H, item_type))
+                index += 1
             
-            col += 1
-            if col >= items_per_row:
-                col = 0
-                row += 1
+            y += -(-count // self._ITEMS_PER_ROW) * self._CELL_H  # Rows used, partial last row included
+        
+        self._pending_items.reverse()  # Popped from the end, top rows first
+        self._materialize_items()
     
-    def create_item_widget(self, filename: str, assets_path: str, row: int, col: int, item_type: str):
-        """Creates a widget for a single fish/item"""
+    def _materialize_items(self):
+        """Builds the next batch of queued item cells and reschedules itself until none are left"""
+        try:
+            if not self.window.winfo_exists():
+                return
+        except tk.TclError:
+            return
+        
+        for _ in range(min(self._ITEMS_PER_BATCH, len(self._pending_items))):
+            filename, thumbnail, x, y, item_type = self._pending_items.pop()
+            self.create_item_widget(filename, self._display_name(filename), thumbnail, x, y, item_type)
+        
+        if self._pending_items:
+            self.window.after(1, self._materialize_items)
+    
+    @staticmethod
+    def _load_thumbnail(img_path: str) -> Image.Image:
+        """Returns the 36x36 thumbnail of an asset image, from the disk cache when the source file
+        hasn't changed; otherwise decodes and resamples it and stores the result for next time"""
+        with open(img_path, 'rb') as f:
+            digest = hashlib.sha1(f.read())
+        digest.update("{}x{}".format(*FishSelectionWindow._THUMB_SIZE).encode())
+        key = digest.hexdigest()
+        FishSelectionWindow._thumb_keys_used.add(key)
+        cache_path = os.path.join(FishSelectionWindow._THUMB_CACHE_DIR, key + ".png")
+        
+        if os.path.exists(cache_path):
+            try:
+                img = Image.open(cache_path)
+                img.load()
+                return img
+            except Exception:
+                pass  # Corrupt cache entry - rebuild it below
+        
+        img = None
+        if pyvips is not None:
+            try:
+                # size="force" gives exactly 36x36 like resize() below, without cropping
+                width, height = FishSelectionWindow._THUMB_SIZE
+                png = pyvips.Image.thumbnail(img_path, width, height=height, size="force").write_to_buffer(".png")
+                img = Image.open(io.BytesIO(png))
+                img.load()
+            except Exception:
+                img = None
+        if img is None:
+            img = Image.open(img_path)
+            # JPEGs decode at a 1/2-1/8 DCT scale that still covers 36x36 (no-op for other formats)
+            img.draft("RGB", FishSelectionWindow._THUMB_SIZE)
+            img = img.resize(FishSelectionWindow._THUMB_SIZE, Image.Resampling.LANCZOS)
+        try:
+            os.makedirs(FishSelectionWindow._THUMB_CACHE_DIR, exist_ok=True)
+            img.save(cache_path, "PNG")
+        except Exception:
+            pass  # Cache is best effort (read-only temp dir, mode PNG can't store)
+        return img
+    
+    @staticmethod
+    def _prune_thumb_cache():
+        """Deletes cached thumbnails no asset mapped to in this run (replaced or removed assets)"""
+        keep = {key + ".png" for key in FishSelectionWindow._thumb_keys_used}
+        try:
+            with os.scandir(FishSelectionWindow._THUMB_CACHE_DIR) as entries:
+                stale = [entry.path for entry in entries if entry.name not in keep]
+        except OSError:
+            return
+        for path in stale:
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+    
+    @staticmethod
+    def _try_load_thumbnail(img_path: str) -> Optional[Image.Image]:
+        """_load_thumbnail for the decode pool: None instead of raising for an unreadable image"""
+        try:
+            return FishSelectionWindow._load_thumbnail(img_path)
+        except Exception:
+            return None
+    
+    @staticmethod
+    def _display_name(filename: str) -> str:
+        """Item name shown under the thumbnail: suffix stripped, underscores to spaces, max 10 chars"""
+        name = FishSelectionWindow._display_names.get(filename)
+        if name is None:
+            name = FishSelectionWindow._ASSET_SUFFIX_RE.sub('', filename).replace('_', ' ')
+            # Truncate long names
+            if len(name) > 10:
+                name = name[:9] + '..'
+            FishSelectionWindow._display_names[filename] = name
+        return name
+    
+    @staticmethod
+    def _intern_photo(thumbnail: Image.Image) -> ImageTk.PhotoImage:
+        """Returns the shared PhotoImage for this thumbnail's pixels, creating it the first time"""
+        key = (thumbnail.mode, thumbnail.size, hashlib.sha1(thumbnail.tobytes()).digest())
+        photo = FishSelectionWindow._photos_by_content.get(key)
+        if photo is None:
+            photo = ImageTk.PhotoImage(thumbnail)
+            FishSelectionWindow._photos_by_content[key] = photo
+        return photo
+    
+    def create_item_widget(self, filename: str, display_name: str, thumbnail: Optional[Image.Image],
+                           x: int, y: int, item_type: str):
+        """Draws a single fish/item cell on the canvas with its top-left corner at (x, y)
+        (thumbnail is None if the image couldn't be loaded or its PhotoImage is already cached)"""
+        canvas = self.canvas
+        center_x = x + (self._CELL_W - 2) // 2
+        
         # Item container
-        item_frame = tk.Frame(self.scrollable_frame, bg="#2a2a2a", padx=1, pady=1)
-        item_frame.grid(row=row, column=col, padx=1, pady=1, sticky="nsew")
+        canvas.create_rectangle(x, y, x + self._CELL_W - 2, y + self._CELL_H - 2, fill="#2a2a2a", width=0)
         
-        # Load and resize image
+        # Show the cached PhotoImage, or build it from the pre-decoded thumbnail
         try:
-            img_path = os.path.join(assets_path, filename)
-            img = Image.open(img_path)
-            img = img.resize((36, 36), Image.Resampling.LANCZOS)
-            photo = ImageTk.PhotoImage(img)
-            self.photo_images.append(photo)  # Keep reference
-            
-            img_label = tk.Label(item_frame, image=photo, bg="#2a2a2a")
-            img_label.pack(pady=0)
+            photo = self.thumb_cache.get(filename)
+            if photo is None:
+                if thumbnail is None:
+                    raise ValueError(f"Could not load {filename}")
+                photo = self._intern_photo(thumbnail)
+                self.thumb_cache[filename] = photo  # Also keeps the PhotoImage alive for the canvas
+            canvas.create_image(center_x, y + 3, image=photo, anchor="n")
         except Exception as e:
             # Fallback if image can't be loaded
-            img_label = tk.Label(item_frame, text="?", font=("Courier New", 12),
-                               bg="#2a2a2a", fg="#888888", width=3, height=1)
-            img_label.pack(pady=1)
-        
-        # Item name (cleaned up)
-        name = filename.replace('_living.jpg', '').replace('_living.png', '')
-        name = name.replace('_item.jpg', '').replace('_item.png', '')
-        name = name.replace('_', ' ')
-        # Truncate long names
-        if len(name) > 10:
-            name = name[:9] + '..'
-        
-        name_label = tk.Label(item_frame, text=name, font=("Courier New", 7),
-                             bg="#2a2a2a", fg="#ffffff")
-        name_label.pack(pady=0)
-        
-        # Action buttons frame (single row layout)
-        buttons_frame = tk.Frame(item_frame, bg="#2a2a2a")
-        buttons_frame.pack(pady=0)
+            canvas.create_text(center_x, y + 21, text="?", font=("Courier New", 12), fill="#888888")
+        
+        canvas.create_text(center_x, y + 42, text=display_name, font=("Courier New", 7), fill="#ffffff", anchor="n")
         
         # Store current action - DEFAULT to 'keep' if not previously set
         current_action = self.current_actions.get(filename, 'keep')
         
-        # Create action buttons: Fish get K D O, Items get K D only
+        # Create action buttons (single row, centered): a rectangle and a label each, both clickable
+        # through the shared "action_button" tag bindings
         buttons = {}
-        if item_type == 'fish':
-            button_actions = [('keep', 'K'), ('drop', 'D'), ('open', 'O')]
-        else:
-            button_actions = [('keep', 'K'), ('drop', 'D')]
+        targets = self._button_targets
+        button_actions = self._FISH_ACTIONS if item_type == 'fish' else self._ITEM_ACTIONS
+        btn_x = center_x - len(button_actions) * self._BTN_W // 2
+        btn_y = y + self._CELL_H - self._BTN_H - 5
         
         for idx, (action, symbol) in enumerate(button_actions):
-            btn = tk.Button(buttons_frame, text=symbol, width=3,
-                           font=("Courier New", 6, "bold"),
-                           cursor="hand2",
-                           padx=1, pady=0,
-                           command=lambda f=filename, a=action: self.toggle_action(f, a))
-            btn.grid(row=0, column=idx, padx=0, pady=0)
-            buttons[action] = btn
+            left = btn_x + idx * self._BTN_W
+            # Tagged per (item type, action) so the Set All buttons can restyle every cell at once
+            # Created already colored for the current action (no update_button_colors pass afterwards)
+            rect_style, text_style = self._ACTIVE_STYLES[action] if action == current_action else self._INACTIVE_STYLE
+            rect = canvas.create_rectangle(left, btn_y, left + self._BTN_W - 1, btn_y + self._BTN_H,
+                                           tags=(f"{item_type}:{action}:rect", "action_button"), **rect_style)
+            text = canvas.create_text(left + self._BTN_W // 2, btn_y + self._BTN_H // 2 + 1, text=symbol,
+                                      font=self._BTN_FONT, tags=(f"{item_type}:{action}:text", "action_button"),
+                                      **text_style)
+            targets[rect] = targets[text] = (filename, action)
+            buttons[action] = (rect, text)
         
         # Store widget references
         self.item_widgets[filename] = {
-            'frame': item_frame,
             'buttons': buttons,
             'current_action': current_action,
             'item_type': item_type
@@ -286,9 +467,13 @@ class FishSelectionWindow:
         # Make sure default action is saved
         if current_action and filename not in self.current_actions:
             self.current_actions[filename] = current_action
-        
-        # Update button colors to reflect current action
-        self.update_button_colors(filename)
+    
+    def _on_action_button_click(self, event):
+        """Routes a click on any action button item to toggle_action for its cell"""
+        current = self.canvas.find_withtag("current")
+        target = self._button_targets.get(current[0]) if current else None
+        if target:
+            self.toggle_action(*target)
     
     def toggle_action(self, filename: str, action: str):
         """Sets an action for a fish/item (only allows switching to different actions)"""
@@ -309,38 +494,50 @@ class FishSelectionWindow:
             return
         
         current = widget['current_action']
+        itemconfig = self.canvas.itemconfig
         
-        for action, btn in widget['buttons'].items():
-            if action == current:
-                btn.config(bg=self.ACTION_COLORS[action], fg="white", relief=tk.SUNKEN)
-            else:
-                btn.config(bg="#555555", fg="#aaaaaa", relief=tk.RAISED)
+        for action, (rect, text) in widget['buttons'].items():
+            rect_style, text_style = self._ACTIVE_STYLES[action] if action == current else self._INACTIVE_STYLE
+            itemconfig(rect, **rect_style)
+            itemconfig(text, **text_style)
+    
+    def _restyle_all(self, item_type: str, current: Optional[str]):
+        """Colors the buttons of every drawn cell of one type as if `current` were selected.
+        Goes through the per-action canvas tags: a few itemconfig calls instead of several per cell."""
+        itemconfig = self.canvas.itemconfig
+        actions = self._FISH_ACTIONS if item_type == 'fish' else self._ITEM_ACTIONS
+        for action, _ in actions:
+            rect_style, text_style = self._ACTIVE_STYLES[action] if action == current else self._INACTIVE_STYLE
+            itemconfig(f"{item_type}:{action}:rect", **rect_style)
+            itemconfig(f"{item_type}:{action}:text", **text_style)
     
     def set_all_actions(self, action: str):
-        """Sets the same action for all items"""
-        for filename, widget in self.item_widgets.items():
-            widget['current_action'] = action
+        """Sets the same action for all items (cells not built yet pick it up from current_actions)"""
+        for filename in self.item_types:
             if action:
                 self.current_actions[filename] = action
             else:
                 self.current_actions.pop(filename, None)
-            self.update_button_colors(filename)
+        for widget in self.item_widgets.values():
+            widget['current_action'] = action
+        self._restyle_all('fish', action)
+        self._restyle_all('item', action)
     
     def set_all_fish_open(self):
         """Sets 'open' action for all fish only (items are not affected)"""
-        for filename, widget in self.item_widgets.items():
+        for filename, item_type in self.item_types.items():
             # Only apply to fish, not items
-            if widget['item_type'] == 'fish':
-                widget['current_action'] = 'open'
+            if item_type == 'fish':
                 self.current_actions[filename] = 'open'
-                self.update_button_colors(filename)
+                widget = self.item_widgets.get(filename)
+                if widget:
+                    widget['current_action'] = 'open'
+        self._restyle_all('fish', 'open')
     
     def save_and_close(self):
         """Saves the current actions and closes the window"""
         # Validate: all items must have an action selected
-        items_without_action = [filename for filename, action in self.current_actions.items() if action is None]
-        
-        if items_without_action:
+        if any(action is None for action in self.current_actions.values()):
             messagebox.showwarning("Incomplete Selection", 
                                  "All fish and items must have an action selected!\n\n"
                                  "Fish: Keep, Drop, or Open\n"
@@ -348,8 +545,7 @@ class FishSelectionWindow:
             return
         
         # Check if any item is set to 'drop' and drop positions are not configured
-        items_to_drop = [name for name, action in self.current_actions.items() if action == 'drop']
-        if items_to_drop:
+        if any(action == 'drop' for action in self.current_actions.values()):
             drop_pos = self.config.get('drop_button_pos')
             confirm_pos = self.config.get('confirm_button_pos')
             
@@ -410,6 +606,34 @@ class BotGUI:
     
     BOT_VERSION = "1.0.5.1"  # Version for config validation and GUI display
     ACCENT_COLOR = "#FFBB00"  # Gold color used throughout the GUI
+    _HIDDEN_POLL_MS = 250  # GIF / RGB wave check-back interval while the main window is minimized
+    _SAVE_DELAY_MS = 250  # save_config batches the changes made within this window into one write
+    
+    # Position capture mode -> (config key, coordinate label attribute, status name)
+    _POSITION_CAPTURE_TARGETS = {
+        'drop': ('drop_button_pos', 'drop_btn_pos_label', "Drop button"),
+        'confirm': ('confirm_button_pos', 'confirm_btn_pos_label', "Confirm button"),
+        'armor': ('armor_slot_pos', 'armor_slot_label', "Armor slot"),
+    }
+    
+    # Per-window status indicator: state -> dot color (drawn once into a PhotoImage per state)
+    _STATUS_COLORS = {
+        'idle': "#888888",
+        'running': "#00ff00",
+        'paused': "#f39c12",
+        'stopped': "#e74c3c",
+    }
+    _STATUS_DOT_SIZE = 10
+    
+    _BAIT_KEY_ORDER = ('1', '2', '3', '4', 'F1', 'F2', 'F3', 'F4')  # Order bait keys are used in
+    
+    # Saved config entries load_config copies into self.config as-is
+    _RESTORED_CONFIG_KEYS = (
+        'human_like_clicking', 'quick_skip', 'quick_skip_mode', 'sound_alert_on_finish',
+        'classic_fishing', 'classic_fishing_delay', 'bait_keys', 'auto_fish_handling',
+        'fish_actions', 'drop_button_pos', 'confirm_button_pos', 'armor_slot_pos',
+        'accent_color', 'rgb_wave_active',
+    )
     
     def __init__(self):
         self.root = tk.Tk()
@@ -418,12 +642,12 @@ class BotGUI:
         # Calculate window height based on DPI scaling
         base_height = 430
         base_width = 660
-        try:
-            dpi_scale = ctypes.windll.shcore.GetScaleFactorForDevice(0) / 100.0
+        dpi_scale = _dpi_scale()
+        if dpi_scale is not None:
             # Increase height proportionally for high DPI (add extra space)
             window_height = int(base_height * max(1.43, dpi_scale * 1.3))
             window_width = int(base_width * max(1.0, dpi_scale * 0.96))
-        except Exception:
+        else:
             window_height = base_height
             window_width = base_width
         
@@ -445,17 +669,33 @@ class BotGUI:
         
         # Multi-window support: up to 8 bots
         self.bots: Dict[int, FishingBot] = {}  # bot_id -> FishingBot
+        self._running_bot_ids = set()  # Bots started and not yet stopped (the Active Windows count)
         self.bot_threads: Dict[int, threading.Thread] = {}  # bot_id -> Thread
         self.window_managers: Dict[int, WindowManager] = {}  # bot_id -> WindowManager
         self.window_selections: Dict[int, tk.StringVar] = {}  # bot_id -> selected window name
+        self._window_selected = [False] * MAX_WINDOWS  # Mirror of bool(window_selections[i]), kept by a var trace
+        self._selected_names: Dict[int, str] = {}  # bot_id -> selected window name (non-empty only), same trace
+        self._window_map: Dict[str, object] = {}  # display name -> window, from the last refresh_windows
+        self._combo_values = None  # Values tuple last pushed to the window combos by refresh_windows
         self.window_stats: Dict[int, dict] = {}  # bot_id -> {hits, games, bait}
+        self.status_log_window = None  # StatusLogWindow, created in setup_ui when DEBUG_MODE_EN
+        if not DEBUG_MODE_EN:
+            # Nothing would ever be shown: bind add_status to a no-op so callers skip the guard chain
+            self.add_status = self._discard_status
+        self._stats_lock = threading.Lock()  # Guards the two fields below (written by the bot threads)
+        self._stats_pending = set()  # bot_ids whose labels are waiting for _flush_stats
+        self._stats_flush_scheduled = False
+        self._label_texts = {}  # Stats label -> text last set through _set_label_text
         self.ignored_positions_windows: Dict[int, IgnoredPositionsWindow] = {}  # bot_id -> IgnoredPositionsWindow
         self.fish_detector_debug_windows: Dict[int, FishDetectorDebugWindow] = {}  # bot_id -> FishDetectorDebugWindow
         
         # Global keyboard listener for F5 pause
         self.global_key_listener = None
+        self._f5_held = False  # Set on the listener thread between F5 press and release (drops auto-repeat)
+        self._f5_toggle_pending = False  # A toggle is queued on the Tk thread and hasn't run yet
         if keyboard:
-            self.global_key_listener = keyboard.Listener(on_press=self.on_global_key_press)
+            self.global_key_listener = keyboard.Listener(on_press=self.on_global_key_press,
+                                                         on_release=self.on_global_key_release)
             self.global_key_listener.start()
         
         # Cooldown for button presses (1 second between actions)
@@ -491,9 +731,20 @@ class BotGUI:
         # Fish selection window reference
         self.fish_selection_window = None
         
+        # Deferred config saving, see save_config
+        self._save_lock = threading.Lock()
+        self._save_pending = False
+        self._thumb_cache: Dict[str, ImageTk.PhotoImage] = {}  # Selection window thumbnails, kept across openings
+        
         # RGB wave effect state
         self.rgb_wave_active = False
         self.rgb_wave_hue = 0
+        self._accent_widgets = None  # (widget, options) following the accent color, see change_accent_color
+        
+        # Main window visibility, tracked from <Map>/<Unmap> so the periodic UI work can pause cheaply
+        self._root_visible = True
+        self.root.bind("<Map>", self._on_root_map, add="+")
+        self.root.bind("<Unmap>", self._on_root_unmap, add="+")
         
         # Load config from file if it exists
         self.load_config()
@@ -516,39 +767,33 @@ class BotGUI:
         gif_path = get_resource_path("monkey-eating.gif")
         self.photo_images = []
         self.current_frame = 0
-        self.gif_label_left = None
-        self.gif_label_right = None
+        self.gif_canvas = None  # Header canvas; both GIF copies are image items tagged "gif_frame"
+        self._gif_pil_frames = []  # Frames 1..n decoded by the GIF thread, turned into PhotoImages as they're reached
+        self._gif_decode_done = True
         
         if os.path.exists(gif_path):
             try:
-                img = Image.open(gif_path)
-                # Extract all frames from the GIF
-                for frame_index in range(img.n_frames):
-                    img.seek(frame_index)
-                    frame = img.convert("RGBA")
-                    frame.thumbnail((200, 120), Image.Resampling.LANCZOS)
-                    self.photo_images.append(ImageTk.PhotoImage(frame))
+                # Only the first frame is decoded here (it sizes the header); the rest on a worker thread
+                gif = Image.open(gif_path)
+                self.photo_images.append(ImageTk.PhotoImage(self._decode_gif_frame(gif)))
+                if gif.n_frames > 1:
+                    self._gif_decode_done = False
+                    threading.Thread(target=self._decode_gif_worker, args=(gif,), daemon=True,
+                                     name="GifDecode").start()
+                else:
+                    gif.close()
             except Exception as e:
                 if DEBUG_PRINTS:
                     print(f"Error loading GIF: {e}")
         
-        # Header (always created)
-        header = tk.Frame(self.root, bg="#000000", height=100 if self.photo_images else 45)
+        # Header (always created): one canvas holding both GIF copies as image items, so a frame
+        # change is a single itemconfigure for the two of them, with the title embedded between
+        header = tk.Canvas(self.root, bg="#000000", height=100 if self.photo_images else 45,
+                           highlightthickness=0, bd=0)
         header.pack(fill=tk.X)
-        header.pack_propagate(False)
-        
-        # Header content frame
-        header_content = tk.Frame(header, bg="#000000")
-        header_content.pack(pady=5)
-        
-        # Left GIF (only if loaded)
-        if self.photo_images:
-            self.gif_label_left = tk.Label(header_content, image=self.photo_images[0], bg="#000000")
-            self.gif_label_left.pack(side=tk.LEFT, padx=10)
         
         # Title and Discord info container
-        title_container = tk.Frame(header_content, bg="#000000")
-        title_container.pack(side=tk.LEFT, padx=10)
+        title_container = tk.Frame(header, bg="#000000")
         
         # Title (always shown)
         title = tk.Label(title_container, text=f"Fishing Puzzle Player v{self.BOT_VERSION}", 
@@ -562,12 +807,33 @@ class BotGUI:
                                 bg="#000000", fg=BotGUI.ACCENT_COLOR)
         discord_label.pack(anchor=tk.CENTER)
         
-        # Right GIF (only if loaded)
+        title_item = header.create_window(0, 0, window=title_container)
+        gif_items = []
+        if self.photo_images:
+            gif_items = [header.create_image(0, 0, image=self.photo_images[0], tags="gif_frame")
+                         for _ in range(2)]
+            self.gif_canvas = header
+        
+        def layout_header(event):
+            # Same arrangement the old packed row had: GIF | title | GIF, centered, 10px padding
+            # around each, 5px from the top, everything vertically centered on the tallest
+            title_w = title_container.winfo_reqwidth()
+            content_h = title_container.winfo_reqheight()
+            gif_w = 0
+            if gif_items:
+                gif_w = self.photo_images[0].width()
+                content_h = max(content_h, self.photo_images[0].height())
+            center_x, center_y = event.width / 2, 5 + content_h / 2
+            header.coords(title_item, center_x, center_y)
+            if gif_items:
+                offset = title_w / 2 + 20 + gif_w / 2
+                header.coords(gif_items[0], center_x - offset, center_y)
+                header.coords(gif_items[1], center_x + offset, center_y)
+        
+        header.bind("<Configure>", layout_header)
+        
+        # Start GIF animation (only if GIFs loaded)
         if self.photo_images:
-            self.gif_label_right = tk.Label(header_content, image=self.photo_images[0], bg="#000000")
-            self.gif_label_right.pack(side=tk.LEFT, padx=10)
-            
-            # Start GIF animation (only if GIFs loaded)
             self.animate_gif()
         
         # Main container
@@ -596,6 +862,8 @@ class BotGUI:
         # Window combos storage
         self.window_combos = {}
         self.window_status_labels = {}
+        self._window_status = {}  # bot_id -> current indicator state, see _set_window_status
+        self._status_images = {state: self._make_status_dot(color) for state, color in self._STATUS_COLORS.items()}
         self.window_bait_labels = {}
         self.window_games_labels = {}
         
@@ -611,6 +879,7 @@ class BotGUI:
             
             # Window selection combo
             self.window_selections[i] = tk.StringVar()
+            self.window_selections[i].trace_add("write", lambda *_, idx=i: self._on_selection_written(idx))
             combo = ttk.Combobox(row_frame, textvariable=self.window_selections[i], 
                                 state="readonly", width=32)
             combo.pack(side=tk.LEFT, padx=2)
@@ -619,11 +888,11 @@ class BotGUI:
             self.window_combos[i] = combo
             
             # Status indicator
-            status_label = tk.Label(row_frame, text="⚪", 
-                                   bg="#2a2a2a", fg="#888888",
-                                   font=("Courier New", 10))
-            status_label.pack(side=tk.LEFT, padx=3)
+            status_label = tk.Label(row_frame, image=self._status_images['idle'], 
+                                   bg="#2a2a2a", bd=0)
+            status_label.pack(side=tk.LEFT, padx=5)
             self.window_status_labels[i] = status_label
+            self._window_status[i] = 'idle'
             
             # Bait counter
             bait_label = tk.Label(row_frame, text="B:---", 
@@ -711,14 +980,14 @@ class BotGUI:
                 bg="#2a2a2a", fg="#ffffff",
                 font=("Courier New", 8), anchor=tk.W, justify=tk.LEFT).grid(row=2, column=0, sticky=tk.W, pady=2)
         # Calculate total bait across selected windows only
-        total_bait = sum(self.window_stats[i]['bait'] for i in range(MAX_WINDOWS) if self.window_selections[i].get())
+        total_bait = self._total_bait()
         self.bait_label = tk.Label(stats_grid, text=str(total_bait), 
                                   bg="#2a2a2a", fg=BotGUI.ACCENT_COLOR,
                                   font=("Courier New", 8, "bold"))
         self.bait_label.grid(row=2, column=1, sticky=tk.W, padx=5, pady=2)
         
         # Bait capacity
-        self.bait_capacity_text_label = tk.Label(stats_grid, text="", 
+        self.bait_capacity_text_label = tk.Label(stats_grid, text="Bait\nper\nclient", 
                                                  bg="#2a2a2a", fg="#ffffff",
                                                  font=("Courier New", 8), anchor=tk.W, justify=tk.LEFT)
         self.bait_capacity_text_label.grid(row=3, column=0, sticky=tk.W, pady=2)
@@ -878,9 +1147,13 @@ class BotGUI:
         num_keys_frame.pack(fill=tk.X)
         
         self.bait_key_vars = {}
+        self._selected_bait_keys = []  # Checked keys in key order, kept by _on_bait_key_written
+        self._max_bait_capacity = 0  # 200 per checked key, kept alongside _selected_bait_keys
+        self._capacity_label_look = (None, None)  # (text, fg) last applied by update_bait_capacity
         self.bait_key_checkboxes = {}  # Store references for enabling/disabling
-        for key in ['1', '2', '3', '4']:
+        for key in self._BAIT_KEY_ORDER[:4]:
             var = tk.BooleanVar(value=key in saved_bait_keys)
+            var.trace_add("write", self._on_bait_key_written)
             self.bait_key_vars[key] = var
             cb = tk.Checkbutton(num_keys_frame, text=key, variable=var,
                                command=self.update_bait_capacity,
@@ -897,8 +1170,9 @@ class BotGUI:
         fn_keys_frame = tk.Frame(keys_container, bg="#2a2a2a")
         fn_keys_frame.pack(fill=tk.X)
         
-        for key in ['F1', 'F2', 'F3', 'F4']:
+        for key in self._BAIT_KEY_ORDER[4:]:
             var = tk.BooleanVar(value=key in saved_bait_keys)
+            var.trace_add("write", self._on_bait_key_written)
             self.bait_key_vars[key] = var
             cb = tk.Checkbutton(fn_keys_frame, text=key, variable=var,
                                command=self.update_bait_capacity,
@@ -912,6 +1186,7 @@ class BotGUI:
             self.bait_key_checkboxes[key] = cb
         
         # Now that bait_key_vars exists, update capacity for the first time
+        self._on_bait_key_written()
         self.update_bait_capacity()
         
         # RIGHT SECTION: Quick Skip (moved after Bait Keys to be closer)
@@ -1196,27 +1471,59 @@ class BotGUI:
         # Restore previously selected windows if they exist
         if self.previous_windows:
             try:
-                current_windows = set(self.window_combos[0]['values'])
+                current_windows = set(self._combo_values or ())
                 for i, prev_win in enumerate(self.previous_windows):
                     if i < MAX_WINDOWS and prev_win and prev_win in current_windows:
                         self.window_selections[i].set(prev_win)
                         # Update bait label for restored window
                         self.window_stats[i]['bait'] = self.bait
-                        self.window_bait_labels[i].config(text=f"B:{self.bait}")
+                        self._set_label_text(self.window_bait_labels[i], f"B:{self.bait}")
                         self.add_status(f"Restored window {i+1}: {prev_win}")
                 # Update total bait label after restoring windows
-                total_bait = sum(self.window_stats[i]['bait'] for i in range(MAX_WINDOWS) if self.window_selections[i].get())
-                self.bait_label.config(text=str(total_bait))
+                total_bait = self._total_bait()
+                self._set_label_text(self.bait_label, str(total_bait))
             except Exception as e:
                 if DEBUG_PRINTS:
                     print(f"Error restoring window selection: {e}")
         
-        # Donations Section (at the very bottom)
+        # Donations Section (at the very bottom). Only the toggle button is created here; the
+        # icon, address label and copy button are built by toggle_donations on first use
         donations_frame = tk.Frame(self.root, bg="#000000")
         donations_frame.pack(fill=tk.X, side=tk.BOTTOM)
         
-        donations_text_frame = tk.Frame(donations_frame, bg="#000000")
-        donations_text_frame.pack(pady=2)
+        self._donations_row = tk.Frame(donations_frame, bg="#000000")
+        self._donations_row.pack(pady=2)
+        self._donations_text_frame = None
+        
+        self.btc_address = "3AGrrTf1v9QZsMPEoezYTRbf9JyW4nQtHu"
+        self.donations_toggle_btn = tk.Button(self._donations_row,
+                                              text="Show donation info",
+                                              command=self.toggle_donations,
+                                              font=("Courier New", 9),
+                                              bg="#000000", fg=BotGUI.ACCENT_COLOR,
+                                              activebackground="#1a1a1a", activeforeground=BotGUI.ACCENT_COLOR,
+                                              relief=tk.FLAT,
+                                              cursor="hand2",
+                                              padx=3, pady=1)
+        self.donations_toggle_btn.pack(side=tk.LEFT, padx=2)
+    
+    def toggle_donations(self):
+        """Shows or hides the donation info, building its widgets the first time it's shown."""
+        if self._donations_text_frame is None:
+            self._build_donations()
+        elif self._donations_text_frame.winfo_ismapped():
+            self._donations_text_frame.pack_forget()
+            self.donations_toggle_btn.config(text="Show donation info")
+            return
+        else:
+            self._donations_text_frame.pack(side=tk.LEFT)
+        self.donations_toggle_btn.config(text="Hide donation info")
+    
+    def _build_donations(self):
+        """Creates the BTC icon, donation address label and copy button (once)."""
+        donations_text_frame = tk.Frame(self._donations_row, bg="#000000")
+        donations_text_frame.pack(side=tk.LEFT)
+        self._donations_text_frame = donations_text_frame
         
         # Try to load BTC icon
         btc_icon_path = get_resource_path("btc_icon.png")
@@ -1245,7 +1552,6 @@ class BotGUI:
             if DEBUG_PRINTS:
                 print(f"BTC icon not found at {btc_icon_path}")
         
-        self.btc_address = "3AGrrTf1v9QZsMPEoezYTRbf9JyW4nQtHu"
         self.donations_label = tk.Label(donations_text_frame, 
                                   text=f"Donations: {self.btc_address}",
                                   font=("Courier New", 9),
@@ -1263,6 +1569,9 @@ class BotGUI:
                             cursor="hand2",
                             padx=3, pady=1)
         copy_btn.pack(side=tk.LEFT, padx=2)
+        
+        # New accent-colored widgets: make the next accent change re-walk the tree
+        self._accent_widgets = None
     
     def load_config(self):
         """
@@ -1272,7 +1581,8 @@ class BotGUI:
         """
         if os.path.exists(self.config_file):
             try:
-                with open(self.config_file, 'r') as f:
+                # UTF-8 explicitly: orjson writes window titles unescaped (older ASCII-only files read the same)
+                with open(self.config_file, 'r', encoding='utf-8') as f:
                     saved_config = json.load(f)
                     
                     # Check version - if missing or different, treat as invalid and skip loading
@@ -1283,44 +1593,16 @@ class BotGUI:
                         self.previous_windows = []
                         return
                     
-                    # Restore config settings
-                    if 'human_like_clicking' in saved_config:
-                        self.config['human_like_clicking'] = saved_config['human_like_clicking']
-                    if 'quick_skip' in saved_config:
-                        self.config['quick_skip'] = saved_config['quick_skip']
-                    if 'quick_skip_mode' in saved_config:
-                        self.config['quick_skip_mode'] = saved_config['quick_skip_mode']
-                    if 'sound_alert_on_finish' in saved_config:
-                        self.config['sound_alert_on_finish'] = saved_config['sound_alert_on_finish']
-                    if 'classic_fishing' in saved_config:
-                        self.config['classic_fishing'] = saved_config['classic_fishing']
-                    if 'classic_fishing_delay' in saved_config:
-                        self.config['classic_fishing_delay'] = saved_config['classic_fishing_delay']
-                    # Restore bait keys
-                    if 'bait_keys' in saved_config:
-                        self.config['bait_keys'] = saved_config['bait_keys']
+                    # Restore config settings (clicking, quick skip, classic fishing, bait keys, fish
+                    # handling, captured positions, accent color, RGB wave) in one pass
+                    self.config.update({key: saved_config[key] for key in self._RESTORED_CONFIG_KEYS
+                                        if key in saved_config})
                     # Restore bait counter
                     if 'bait' in saved_config:
                         self.bait = saved_config['bait']
-                    # Restore auto fish handling settings
-                    if 'auto_fish_handling' in saved_config:
-                        self.config['auto_fish_handling'] = saved_config['auto_fish_handling']
-                    if 'fish_actions' in saved_config:
-                        self.config['fish_actions'] = saved_config['fish_actions']
-                    # Restore drop button positions
-                    if 'drop_button_pos' in saved_config:
-                        self.config['drop_button_pos'] = saved_config['drop_button_pos']
-                    if 'confirm_button_pos' in saved_config:
-                        self.config['confirm_button_pos'] = saved_config['confirm_button_pos']
-                    if 'armor_slot_pos' in saved_config:
-                        self.config['armor_slot_pos'] = saved_config['armor_slot_pos']
-                    # Restore accent color
+                    # Apply restored accent color
                     if 'accent_color' in saved_config:
-                        self.config['accent_color'] = saved_config['accent_color']
                         BotGUI.ACCENT_COLOR = saved_config['accent_color']
-                    # Restore RGB wave state
-                    if 'rgb_wave_active' in saved_config:
-                        self.config['rgb_wave_active'] = saved_config['rgb_wave_active']
                     # Store previously selected windows for later restoration (multi-window)
                     self.previous_windows = saved_config.get('selected_windows', [])
                     # Also support legacy single window
@@ -1334,10 +1616,27 @@ class BotGUI:
             self.previous_windows = []
     
     def save_config(self):
+        """
+        Schedules a save of the current configuration (safe to call from any thread).
+        Every change within _SAVE_DELAY_MS is folded into a single write by _write_config.
+        """
+        with self._save_lock:
+            if self._save_pending:
+                return
+            self._save_pending = True
+        try:
+            self.root.after(self._SAVE_DELAY_MS, self._write_config)
+        except (RuntimeError, tk.TclError):
+            # No event loop (shutting down) - write right away
+            self._write_config()
+    
+    def _write_config(self):
         """
         Saves current configuration to the config file.
         Always saves the bot version for validation on next load.
         """
+        with self._save_lock:
+            self._save_pending = False
         try:
             # Get selected bait keys
             selected_bait_keys = self.get_selected_bait_keys() if hasattr(self, 'bait_key_vars') else ['1', '2', '3', '4']
@@ -1369,80 +1668,88 @@ class BotGUI:
                 'selected_windows': selected_windows,
                 'selected_window': selected_windows[0] if selected_windows else None  # Legacy support
             }
-            with open(self.config_file, 'w') as f:
-                json.dump(config_data, f, indent=2)
+            if orjson is not None:
+                payload = orjson.dumps(config_data, option=orjson.OPT_INDENT_2)
+            else:
+                payload = json.dumps(config_data, indent=2).encode('utf-8')
+            # Write next to the config and swap it in, so a crash mid-write never leaves a truncated file
+            tmp_path = self.config_file + '.tmp'
+            with open(tmp_path, 'wb') as f:
+                f.write(payload)
+            os.replace(tmp_path, self.config_file)
         except Exception as e:
             if DEBUG_PRINTS:
                 print(f"Error saving config: {e}")
     
+    def _on_bait_key_written(self, *_):
+        """Rebuilds the cached bait key selection (runs when a bait key checkbox variable changes)"""
+        key_vars = self.bait_key_vars
+        self._selected_bait_keys = [key for key in self._BAIT_KEY_ORDER if key in key_vars and key_vars[key].get()]
+        self._max_bait_capacity = len(self._selected_bait_keys) * 200
+    
     def get_selected_bait_keys(self) -> list:
-        """Returns list of selected bait keys in order."""
-        key_order = ['1', '2', '3', '4', 'F1', 'F2', 'F3', 'F4']
-        return [key for key in key_order if self.bait_key_vars.get(key, tk.BooleanVar(value=False)).get()]
+        """Returns list of selected bait keys in order (from the cache, no Tk variable reads)."""
+        return list(self._selected_bait_keys)
     
     def get_max_bait_capacity(self) -> int:
-        """Returns max bait capacity based on selected keys (200 per key)."""
-        return len(self.get_selected_bait_keys()) * 200
+        """Returns max bait capacity based on selected keys (200 per key, cached on checkbox change)."""
+        return self._max_bait_capacity
     
     def update_bait_capacity(self):
         """Updates the bait capacity label based on selected keys."""
         selected_keys = self.get_selected_bait_keys()
         capacity = len(selected_keys) * 200
+        # Only reconfigure the number label when its text or color actually changes
+        capacity_look = (str(capacity), BotGUI.ACCENT_COLOR if capacity > 0 else "#e74c3c")
+        if capacity_look != self._capacity_label_look:
+            self._capacity_label_look = capacity_look
+            self.bait_capacity_number_label.config(text=capacity_look[0], fg=capacity_look[1])
         if capacity > 0:
-            self.bait_capacity_text_label.config(text="Bait\nper\nclient")
-            self.bait_capacity_number_label.config(
-                text=str(capacity),
-                fg=BotGUI.ACCENT_COLOR
-            )
             # Reset bait to new capacity
             self.bait = capacity
-            
-            # Update bait counters and labels for all windows
-            for i in range(MAX_WINDOWS):
-                self.window_stats[i]['bait'] = capacity
-                # Update label - show capacity if selected, otherwise show B:---
-                is_selected = self.window_selections[i].get()
-                if is_selected:
-                    self.window_bait_labels[i].config(text=f"B:{capacity}")
-                else:
-                    self.window_bait_labels[i].config(text="B:---")
-            
-            # Update total bait label with sum of selected windows only
-            total_bait = sum(self.window_stats[i]['bait'] for i in range(MAX_WINDOWS) if self.window_selections[i].get())
-            self.bait_label.config(text=str(total_bait))
-            
-            self.save_config()
-        else:
-            self.bait_capacity_text_label.config(text="Bait\nper\nclient")
-            self.bait_capacity_number_label.config(
-                text=str(capacity),
-                fg="#e74c3c"
-            )
-            self.bait_label.config(text="0")
-            # Reset all window bait displays - selected windows show B:0, unselected show B:---
-            for i in range(MAX_WINDOWS):
-                self.window_stats[i]['bait'] = 0
-                is_selected = self.window_selections[i].get()
-                self.window_bait_labels[i].config(text="B:0" if is_selected else "B:---")
-            self.save_config()
         
+        # Every window gets the new capacity (0 when no key is selected); the label shows it for
+        # selected windows and B:--- otherwise. Texts are built once, selection read from the mirror.
+        selected_text = f"B:{capacity}"
+        selected_count = 0
+        for i, is_selected in enumerate(self._window_selected):
+            self.window_stats[i]['bait'] = capacity
+            self._set_label_text(self.window_bait_labels[i], selected_text if is_selected else "B:---")
+            selected_count += is_selected
+        
+        # Total over the selected windows, all of which now hold `capacity`
+        self._set_label_text(self.bait_label, str(capacity * selected_count))
+        self.save_config()
+    
+    def _get_window_map(self, refresh: bool = False) -> Dict[str, object]:
+        """Returns the display name -> window map built by the last refresh_windows, so lookups
+        resolve against the same names the combos show. Re-enumerates when asked or when empty."""
+        if refresh or not self._window_map:
+            self._window_map = dict(WindowManager.get_all_windows(force_refresh=refresh))
+        return self._window_map
+        
+    @staticmethod
+    def _window_usable(window_dict: Dict[str, object], name: str) -> bool:
+        """True if name is in the window map and its cached handle still refers to a live window"""
+        window = window_dict.get(name)
+        return window is not None and WindowManager.is_window_alive(window)
+    
     def refresh_windows(self):
         """Refreshes the list of available windows for all window combos"""
         try:
-            windows = WindowManager.get_all_windows()
+            windows = WindowManager.get_all_windows(force_refresh=True)
+            self._window_map = dict(windows)
             window_names = [name for name, _ in windows]
             
             # Add empty option at the start to allow unselecting
-            window_names_with_empty = [""] + window_names
-            window_names_set = set(window_names)
+            window_names_with_empty = ("",) + tuple(window_names)
             
-            # Update all window combos and preserve current selections if still available
-            for i in range(MAX_WINDOWS):
-                current_sel = self.window_selections[i].get()
-                self.window_combos[i]['values'] = window_names_with_empty
-                # Restore selection if it's still available
-                if current_sel and current_sel in window_names_set:
-                    self.window_selections[i].set(current_sel)
+            # Push the list to the combos only when it changed since the last refresh (each
+            # assignment copies it into Tcl). Selections live in the textvariables and are kept.
+            if window_names_with_empty != self._combo_values:
+                self._combo_values = window_names_with_empty
+                for i in range(MAX_WINDOWS):
+                    self.window_combos[i]['values'] = window_names_with_empty
             
             if window_names:
                 self.add_status(f"Found {len(window_names)} visible window(s)")
@@ -1458,9 +1765,12 @@ class BotGUI:
         Args:
             message: The status message to display
         """
-        if not DEBUG_MODE_EN or not hasattr(self, 'status_log_window') or not self.status_log_window:
-            return
-        self.status_log_window.add_message(message)
+        log_window = self.status_log_window
+        if log_window is not None:
+            log_window.add_message(message)
+    
+    def _discard_status(self, message: str):
+        """add_status replacement when DEBUG_MODE_EN is off (there is no status log window)"""
     
     def toggle_log_visibility(self):
         """Toggles the visibility of the status log window."""
@@ -1641,98 +1951,88 @@ class BotGUI:
             if hasattr(self, 'confirm_btn_pos_btn'):
                 self.confirm_btn_pos_btn.config(state=tk.DISABLED)
     
-    def change_accent_color(self, new_color: str, from_rgb_wave: bool = False):
-        """Changes the accent color throughout the GUI."""
-        # Stop RGB wave effect if it's running (but not if called from RGB wave itself)
-        if not from_rgb_wave:
-            self.rgb_wave_active = False
+    def _collect_accent_widgets(self) -> list:
+        """Walks the widget tree and returns (widget, option names) for everything that follows
+        the accent color. Cached by change_accent_color so the RGB wave doesn't re-walk it every tick."""
+        targets = []
         
-        # Update the class constant
-        BotGUI.ACCENT_COLOR = new_color
-        
-        # Update all LabelFrame titles and Labels recursively
-        def update_widget_colors(widget):
-            # Update LabelFrame foreground
+        # LabelFrame titles, title/discord/BTC labels and the copy button, found recursively
+        def collect(widget):
             if isinstance(widget, tk.LabelFrame):
-                try:
-                    widget.config(fg=new_color)
-                except:
-                    pass
-            # Update Label foreground for title and discord labels
+                targets.append((widget, ('fg',)))
             elif isinstance(widget, tk.Label):
                 try:
                     text = str(widget.cget('text'))
                     if 'Fishing Puzzle Player' in text or 'Discord:' in text or 'BTC' in text:
-                        widget.config(fg=new_color)
+                        targets.append((widget, ('fg',)))
                 except:
                     pass
-            # Update Button foreground for copy button
             elif isinstance(widget, tk.Button):
                 try:
                     if widget.cget('text') == "📋":
-                        widget.config(fg=new_color, activeforeground=new_color)
+                        targets.append((widget, ('fg', 'activeforeground')))
                 except:
                     pass
             
-            # Recursively update children
             try:
                 for child in widget.winfo_children():
-                    update_widget_colors(child)
+                    collect(child)
             except:
                 pass
         
-        # Start recursive update from root
-        update_widget_colors(self.root)
+        collect(self.root)
+        
+        # Specific buttons and labels with ACCENT_COLOR
+        named = (('refresh_windows_btn', ('fg', 'activeforeground')), ('reset_btn', ('fg',)),
+                 ('select_fishes_btn', ('fg',)), ('drop_btn_pos_btn', ('fg',)),
+                 ('confirm_btn_pos_btn', ('fg',)), ('armor_slot_btn', ('fg',)),
+                 ('quick_skip_help_btn', ('bg', 'activebackground')),
+                 ('drop_help_btn', ('bg', 'activebackground')), ('total_games_label', ('fg',)),
+                 ('active_windows_label', ('fg',)), ('bait_label', ('fg',)),
+                 ('start_pause_btn', ('fg',)), ('stop_all_btn', ('fg',)), ('donations_label', ('fg',)),
+                 ('donations_toggle_btn', ('fg', 'activeforeground')))
+        for attr, options in named:
+            if hasattr(self, attr):
+                targets.append((getattr(self, attr), options))
+        
+        # Window bait and games labels
+        for labels in (self.window_bait_labels, self.window_games_labels):
+            for i in range(MAX_WINDOWS):
+                if i in labels:
+                    targets.append((labels[i], ('fg',)))
+        return targets
+    
+    def change_accent_color(self, new_color: str, from_rgb_wave: bool = False):
+        """Changes the accent color throughout the GUI."""
+        # Stop RGB wave effect if it's running (but not if called from RGB wave itself)
+        if not from_rgb_wave:
+            self.rgb_wave_active = False
+        
+        # Update the class constant
+        BotGUI.ACCENT_COLOR = new_color
+        
+        # Manual changes re-walk the widget tree (windows may have opened since); RGB wave ticks
+        # reuse the cached targets, re-walking on the next tick if one of them was destroyed
+        if not from_rgb_wave or self._accent_widgets is None:
+            self._accent_widgets = self._collect_accent_widgets()
+        for widget, options in self._accent_widgets:
+            try:
+                widget.config(**{option: new_color for option in options})
+            except tk.TclError:
+                self._accent_widgets = None
         
-        # Update all specific buttons and labels with ACCENT_COLOR
-        if hasattr(self, 'refresh_windows_btn'):
-            self.refresh_windows_btn.config(fg=new_color, activeforeground=new_color)
         if hasattr(self, 'bait_capacity_number_label'):
             # Only update if capacity is not 0 (when 0, it should stay red)
             capacity = self.get_max_bait_capacity()
             if capacity > 0:
                 self.bait_capacity_number_label.config(fg=new_color)
-        if hasattr(self, 'reset_btn'):
-            self.reset_btn.config(fg=new_color)
-        if hasattr(self, 'select_fishes_btn'):
-            self.select_fishes_btn.config(fg=new_color)
-        if hasattr(self, 'drop_btn_pos_btn'):
-            self.drop_btn_pos_btn.config(fg=new_color)
-        if hasattr(self, 'confirm_btn_pos_btn'):
-            self.confirm_btn_pos_btn.config(fg=new_color)
-        if hasattr(self, 'armor_slot_btn'):
-            self.armor_slot_btn.config(fg=new_color)
-        if hasattr(self, 'quick_skip_help_btn'):
-            self.quick_skip_help_btn.config(bg=new_color, activebackground=new_color)
-        if hasattr(self, 'drop_help_btn'):
-            self.drop_help_btn.config(bg=new_color, activebackground=new_color)
-        if hasattr(self, 'total_games_label'):
-            self.total_games_label.config(fg=new_color)
-        if hasattr(self, 'active_windows_label'):
-            self.active_windows_label.config(fg=new_color)
-        if hasattr(self, 'bait_label'):
-            self.bait_label.config(fg=new_color)
-        if hasattr(self, 'start_pause_btn'):
-            self.start_pause_btn.config(fg=new_color)
-        if hasattr(self, 'stop_all_btn'):
-            self.stop_all_btn.config(fg=new_color)
-        if hasattr(self, 'donations_label'):
-            self.donations_label.config(fg=new_color)
-        
-        # Update window bait labels
-        for i in range(MAX_WINDOWS):
-            if i in self.window_bait_labels:
-                self.window_bait_labels[i].config(fg=new_color)
+                self._capacity_label_look = (str(capacity), new_color)
         
-        # Update window games labels
-        for i in range(MAX_WINDOWS):
-            if i in self.window_games_labels:
-                self.window_games_labels[i].config(fg=new_color)
-        
-        # Save to config
+        # Save to config (RGB wave ticks only update it in memory; the wave toggle saves)
         self.config['accent_color'] = new_color
-        if not from_rgb_wave:
-            self.config['rgb_wave_active'] = False
+        if from_rgb_wave:
+            return
+        self.config['rgb_wave_active'] = False
         self.save_config()
         
         self.add_status(f"Accent color changed to {new_color}")
@@ -1764,6 +2064,11 @@ class BotGUI:
         if not self.rgb_wave_active:
             return
         
+        # Minimized: nothing to recolor, just check back later
+        if self._root_minimized():
+            self.root.after(self._HIDDEN_POLL_MS, self.update_rgb_wave)
+            return
+        
         # Convert HSV to RGB (hue cycles 0-360)
         import colorsys
         h = self.rgb_wave_hue / 360.0
@@ -1788,37 +2093,14 @@ class BotGUI:
         # If already capturing for this mode, just reactivate the stored window (and minimize others)
         if self._position_capture_mode == mode and hasattr(self, '_position_capture_window') and self._position_capture_window:
             try:
-                all_windows = WindowManager.get_all_windows()
-                window_dict = {name: win for name, win in all_windows}
-                
-                # Minimize all other selected windows first
-                for i in range(MAX_WINDOWS):
-                    window_name = self.window_selections[i].get()
-                    if window_name and window_name != self._position_capture_window:
-                        if window_name in window_dict:
-                            try:
-                                window_dict[window_name].minimize()
-                            except Exception:
-                                pass  # Ignore if minimize fails
-                
-                # Small delay to ensure windows are minimized
-                time.sleep(0.1)
-                
-                # Then activate the target window
-                if self._position_capture_window in window_dict:
-                    target_window = window_dict[self._position_capture_window]
-                    # Restore if minimized
-                    if target_window.isMinimized:
-                        target_window.restore()
-                        time.sleep(0.1)
-                    target_window.activate()
+                if self._focus_capture_window():
                     self.add_status(f"Click on the {mode} button in the game window...")
                     return
             except Exception:
                 pass  # Fall through to normal capture startup
         
         # Check if at least one window is selected
-        selected_windows = [self.window_selections[i].get() for i in range(MAX_WINDOWS) if self.window_selections[i].get()]
+        selected_windows = [name for _, name in self._selected_windows()]
         if not selected_windows:
             messagebox.showerror("No Window Selected", 
                                "Please select at least one game window first!\n\n"
@@ -1840,30 +2122,7 @@ class BotGUI:
         
         # Activate the first selected game window and minimize all others
         try:
-            all_windows = WindowManager.get_all_windows()
-            window_dict = {name: win for name, win in all_windows}
-            
-            # Minimize all other selected windows first
-            for i in range(MAX_WINDOWS):
-                window_name = self.window_selections[i].get()
-                if window_name and window_name != self._position_capture_window:
-                    if window_name in window_dict:
-                        try:
-                            window_dict[window_name].minimize()
-                        except Exception:
-                            pass  # Ignore if minimize fails
-            
-            # Small delay to ensure windows are minimized
-            time.sleep(0.1)
-            
-            # Then activate the target window
-            if self._position_capture_window in window_dict:
-                target_window = window_dict[self._position_capture_window]
-                # Restore if minimized
-                if target_window.isMinimized:
-                    target_window.restore()
-                    time.sleep(0.1)
-                target_window.activate()
+            self._focus_capture_window()
         except Exception as e:
             self.add_status(f"Could not activate window: {e}")
         
@@ -1877,12 +2136,61 @@ class BotGUI:
                     self.root.after(0, lambda: self._capture_position_callback(x, y, mode))
                     return False  # Stop listener
             
+            # A capture for another mode may still be listening - stop it so only one click handler runs
+            if self._position_capture_listener:
+                try:
+                    self._position_capture_listener.stop()
+                except Exception:
+                    pass
+            
             self._position_capture_listener = mouse.Listener(on_click=on_click)
             self._position_capture_listener.start()
         except Exception as e:
             self.add_status(f"Error starting mouse capture: {e}")
             self._reset_position_capture_buttons()
     
+    @staticmethod
+    def _wait_for_windows(windows, minimized: bool, timeout: float = 0.1):
+        """Polls until every window reports the given minimized state, at most `timeout` seconds"""
+        deadline = time.perf_counter() + timeout
+        while time.perf_counter() < deadline:
+            try:
+                if all(win.isMinimized == minimized for win in windows):
+                    return
+            except Exception:
+                return
+            time.sleep(0.01)
+    
+    def _focus_capture_window(self) -> bool:
+        """Minimizes the other selected game windows and activates the position capture target.
+        Returns True if the target window was found and activated."""
+        window_dict = self._get_window_map()
+        
+        # Minimize all other selected windows first
+        minimized = []
+        for _, window_name in self._selected_windows():
+            if window_name != self._position_capture_window:
+                if window_name in window_dict:
+                    try:
+                        window_dict[window_name].minimize()
+                        minimized.append(window_dict[window_name])
+                    except Exception:
+                        pass  # Ignore if minimize fails
+        
+        # Wait until they're actually minimized (returns as soon as they are)
+        self._wait_for_windows(minimized, True)
+        
+        # Then activate the target window
+        if self._position_capture_window not in window_dict:
+            return False
+        target_window = window_dict[self._position_capture_window]
+        # Restore if minimized
+        if target_window.isMinimized:
+            target_window.restore()
+            self._wait_for_windows([target_window], False)
+        target_window.activate()
+        return True
+    
     def _capture_position_callback(self, screen_x: int, screen_y: int, mode: str):
         """Callback when position is captured. Converts screen coords to window-relative."""
         try:
@@ -1895,8 +2203,9 @@ class BotGUI:
                 return
             
             # Get window rect
-            all_windows = WindowManager.get_all_windows()
-            window_dict = {name: win for name, win in all_windows}
+            window_dict = self._get_window_map()
+            if not self._window_usable(window_dict, selected_name):
+                window_dict = self._get_window_map(refresh=True)
             
             if selected_name not in window_dict:
                 self.add_status(f"Window not found: {selected_name}")
@@ -1913,18 +2222,11 @@ class BotGUI:
             rel_y = screen_y - win_top
             
             # Store position in config
-            if mode == 'drop':
-                self.config['drop_button_pos'] = (rel_x, rel_y)
-                self.drop_btn_pos_label.config(text=f"({rel_x},{rel_y})", fg="#ffffff")
-                self.add_status(f"Drop button position set: ({rel_x}, {rel_y})")
-            elif mode == 'confirm':
-                self.config['confirm_button_pos'] = (rel_x, rel_y)
-                self.confirm_btn_pos_label.config(text=f"({rel_x},{rel_y})", fg="#ffffff")
-                self.add_status(f"Confirm button position set: ({rel_x}, {rel_y})")
-            else:  # armor
-                self.config['armor_slot_pos'] = (rel_x, rel_y)
-                self.armor_slot_label.config(text=f"({rel_x},{rel_y})", fg="#ffffff")
-                self.add_status(f"Armor slot position set: ({rel_x}, {rel_y})")
+            config_key, label_attr, name = self._POSITION_CAPTURE_TARGETS.get(
+                mode, self._POSITION_CAPTURE_TARGETS['armor'])
+            self.config[config_key] = (rel_x, rel_y)
+            getattr(self, label_attr).config(text=f"({rel_x},{rel_y})", fg="#ffffff")
+            self.add_status(f"{name} position set: ({rel_x}, {rel_y})")
             
             self.save_config()
             
@@ -1971,7 +2273,8 @@ class BotGUI:
             self.config,  # Pass config to check drop button positions
             BotGUI.ACCENT_COLOR,  # Pass current accent color
             self.rgb_wave_active,  # Pass RGB wave state
-            self.rgb_wave_hue  # Pass current hue
+            self.rgb_wave_hue,  # Pass current hue
+            self._thumb_cache  # PhotoImages built by earlier openings
         )
     
     def on_fish_actions_saved(self, fish_actions: dict):
@@ -1987,48 +2290,131 @@ class BotGUI:
         """Updates bait display when a window is selected."""
         selected_name = self.window_selections[window_id].get()
         
-        # Check if this window is already selected in another slot (optimized check)
+        # Check if this window is already selected in another slot (Python-side mirror, no Tcl reads)
         if selected_name:
-            selected_windows = {self.window_selections[i].get() for i in range(MAX_WINDOWS) if i != window_id}
-            if selected_name in selected_windows:
+            if any(name == selected_name for i, name in self._selected_names.items() if i != window_id):
                 # Window already selected elsewhere, prevent duplicate
                 self.window_selections[window_id].set("")
                 self.add_status(f"Window '{selected_name}' is already selected in another slot")
                 # Reset display
                 self.window_stats[window_id]['bait'] = 0
-                self.window_bait_labels[window_id].config(text="B:---")
+                self._set_label_text(self.window_bait_labels[window_id], "B:---")
                 return
             
             # Window is selected - update bait to current capacity
             self.window_stats[window_id]['bait'] = self.bait
-            self.window_bait_labels[window_id].config(text=f"B:{self.bait}")
+            self._set_label_text(self.window_bait_labels[window_id], f"B:{self.bait}")
         else:
             # Window is unselected - show --- and reset bait to 0
             self.window_stats[window_id]['bait'] = 0
-            self.window_bait_labels[window_id].config(text="B:---")
+            self._set_label_text(self.window_bait_labels[window_id], "B:---")
         
         # Update total bait label to reflect new sum of selected windows
-        total_bait = sum(self.window_stats[i]['bait'] for i in range(MAX_WINDOWS) if self.window_selections[i].get())
-        self.bait_label.config(text=str(total_bait))
+        total_bait = self._total_bait()
+        self._set_label_text(self.bait_label, str(total_bait))
+    
+    def _on_root_map(self, event):
+        """Main window restored: resume and catch up on stats held back while it was hidden"""
+        if event.widget is not self.root:
+            return  # Child widgets' Map events bubble up through the toplevel binding
+        self._root_visible = True
+        with self._stats_lock:
+            held_back = self._stats_flush_scheduled
+        if held_back:
+            self._flush_stats()
+    
+    def _on_root_unmap(self, event):
+        """Main window minimized or withdrawn"""
+        if event.widget is self.root:
+            self._root_visible = False
+    
+    def _root_minimized(self) -> bool:
+        """True while the main window is minimized or withdrawn (animations can pause)"""
+        return not self._root_visible
+    
+    @staticmethod
+    def _decode_gif_frame(gif):
+        """Current GIF frame as an RGBA PIL image fitted into 200x120"""
+        frame = gif.convert("RGBA")
+        # Bilinear is indistinguishable from Lanczos at this size for a looping animation, and much cheaper
+        frame.thumbnail((200, 120), Image.Resampling.BILINEAR)
+        return frame
+    
+    def _decode_gif_worker(self, gif):
+        """Decodes GIF frames 1..n into PIL images off the Tk thread (PhotoImages are made by _gif_frame)"""
+        try:
+            for index in range(1, gif.n_frames):
+                gif.seek(index)
+                self._gif_pil_frames.append(self._decode_gif_frame(gif))
+        except Exception as e:
+            if DEBUG_PRINTS:
+                print(f"Error decoding GIF: {e}")  # Loop over what decoded fine
+        finally:
+            gif.close()
+            self._gif_decode_done = True
+    
+    def _gif_frame(self, index: int):
+        """Returns the PhotoImage for a GIF frame, building it from the decoded PIL frame on first
+        use. None if the decode thread hasn't got that far (or the GIF has fewer frames)."""
+        if index < len(self.photo_images):
+            return self.photo_images[index]
+        
+        pending = self._gif_pil_frames
+        if index - 1 < len(pending):
+            self.photo_images.append(ImageTk.PhotoImage(pending[index - 1]))
+            pending[index - 1] = None  # The PhotoImage holds the pixels now
+            return self.photo_images[index]
+        return None
     
     def animate_gif(self):
         """Animates the GIF frames."""
-        if self.photo_images and (self.gif_label_left or self.gif_label_right):
-            self.current_frame = (self.current_frame + 1) % len(self.photo_images)
-            if self.gif_label_left:
-                self.gif_label_left.config(image=self.photo_images[self.current_frame])
-            if self.gif_label_right:
-                self.gif_label_right.config(image=self.photo_images[self.current_frame])
+        if self.photo_images and self.gif_canvas:
+            if self._root_minimized():
+                self.root.after(self._HIDDEN_POLL_MS, self.animate_gif)
+                return
+            # Read before looking for the next frame: once decoding is done, a missing frame means the end
+            decode_done = self._gif_decode_done
+            if decode_done and len(self.photo_images) + len(self._gif_pil_frames) <= 1:
+                return  # Still image: the canvas already shows it, no need to keep ticking
+            
+            shown = self.current_frame
+            photo = self._gif_frame(shown + 1)
+            if photo is not None:
+                self.current_frame += 1
+            elif decode_done:
+                self.current_frame = 0
+                photo = self.photo_images[0]
+            
+            # No reconfigure while the next frame is still being decoded (the current one stays up)
+            if self.current_frame != shown:
+                self.gif_canvas.itemconfigure("gif_frame", image=photo)
             # Schedule next frame update (30ms for faster animation)
             self.root.after(30, self.animate_gif)
     
     def on_global_key_press(self, key):
         """Global key press handler for F5 pause/resume all bots."""
+        # Filtered on the listener thread: only a fresh F5 press (not auto-repeat while held,
+        # not a second press before the queued toggle ran) wakes the Tk loop
+        if key != keyboard.Key.f5 or self._f5_held:
+            return
+        self._f5_held = True
+        if self._f5_toggle_pending:
+            return
+        self._f5_toggle_pending = True
         try:
-            if key == keyboard.Key.f5:
-                self.root.after(0, self.toggle_pause_all_bots)
-        except AttributeError:
-            pass
+            self.root.after(0, self._run_f5_toggle)
+        except (RuntimeError, tk.TclError):
+            self._f5_toggle_pending = False  # Main loop gone (closing)
+    
+    def on_global_key_release(self, key):
+        """Re-arms the F5 handler once the key is released."""
+        if key == keyboard.Key.f5:
+            self._f5_held = False
+    
+    def _run_f5_toggle(self):
+        """Runs the queued F5 pause/resume on the Tk thread."""
+        self._f5_toggle_pending = False
+        self.toggle_pause_all_bots()
     
     def disable_buttons_for_cooldown(self):
         """Disables all control buttons during cooldown period."""
@@ -2073,37 +2459,84 @@ class BotGUI:
             if bot.running:
                 bot.paused = not any_paused
                 # Update status indicator
-                if bot_id in self.window_status_labels:
-                    if bot.paused:
-                        self.window_status_labels[bot_id].config(text="🟡", fg="#f39c12")
-                    else:
-                        self.window_status_labels[bot_id].config(text="🟢", fg="#00ff00")
+                self._set_window_status(bot_id, 'paused' if bot.paused else 'running')
         
         status = "PAUSED" if not any_paused else "RESUMED"
         self.add_status(f"All bots {status} (F5)")
     
+    def _on_selection_written(self, window_id: int):
+        """Keeps _window_selected in sync with a window selection variable, whoever wrote it"""
+        name = self.window_selections[window_id].get()
+        self._window_selected[window_id] = bool(name)
+        if name:
+            self._selected_names[window_id] = name
+        else:
+            self._selected_names.pop(window_id, None)
+    
+    def _selected_windows(self) -> list:
+        """(slot, window name) for every selected slot in slot order, from the selection mirror"""
+        return sorted(self._selected_names.items())
+    
+    def _total_bait(self) -> int:
+        """Bait left across the selected windows (reads the Python-side selection mirror, no Tcl calls)"""
+        stats = self.window_stats
+        return sum(stats[i]['bait'] for i, selected in enumerate(self._window_selected) if selected)
+    
     def update_stats(self, bot_id: int, hits: int, total_games: int, bait: int):
-        """Updates the statistics display for a specific bot."""
+        """Updates the statistics for a specific bot (called from the bot threads). The stats are
+        stored right away; the labels are refreshed by one _flush_stats per idle cycle, however
+        many bots reported in between."""
         if bot_id in self.window_stats:
             self.window_stats[bot_id] = {'hits': hits, 'games': total_games, 'bait': bait}
         
-        # Update individual window labels
-        if bot_id in self.window_bait_labels:
-            self.window_bait_labels[bot_id].config(text=f"B:{bait}")
-        if bot_id in self.window_games_labels:
-            self.window_games_labels[bot_id].config(text=f"G:{total_games}")
+        with self._stats_lock:
+            self._stats_pending.add(bot_id)
+            if self._stats_flush_scheduled:
+                return
+            self._stats_flush_scheduled = True
+        try:
+            self.root.after_idle(self._flush_stats)
+        except (RuntimeError, tk.TclError):
+            # GUI is shutting down
+            with self._stats_lock:
+                self._stats_flush_scheduled = False
+    
+    def _flush_stats(self):
+        """Refreshes the statistics labels for every bot that reported since the last flush.
+        While the main window is hidden nothing is drawn; the flush stays pending until <Map>."""
+        if not self._root_visible:
+            return
+        with self._stats_lock:
+            bot_ids = self._stats_pending
+            self._stats_pending = set()
+            self._stats_flush_scheduled = False
         
-        # Update total statistics
         total_all_games = sum(s['games'] for s in self.window_stats.values())
-        self.total_games_label.config(text=str(total_all_games))
-        
-        # Update total bait across selected windows only
-        total_bait = sum(self.window_stats[i]['bait'] for i in range(MAX_WINDOWS) if self.window_selections[i].get())
-        self.bait_label.config(text=str(total_bait))
-        
-        # Count active windows
-        active_count = len([b for b in self.bots.values() if b.running])
-        self.active_windows_label.config(text=str(active_count))
+        # Total bait across selected windows only
+        total_bait = self._total_bait()
+        active_count = len(self._running_bot_ids)
+        
+        # (label, text) table; most fields are unchanged after a game so only the differing ones are configured
+        updates = [
+            (self.total_games_label, str(total_all_games)),
+            (self.bait_label, str(total_bait)),
+            (self.active_windows_label, str(active_count)),
+        ]
+        for bot_id in bot_ids:
+            stats = self.window_stats.get(bot_id)
+            if stats is not None:
+                updates.append((self.window_bait_labels.get(bot_id), f"B:{stats['bait']}"))
+                updates.append((self.window_games_labels.get(bot_id), f"G:{stats['games']}"))
+        for label, text in updates:
+            if label is not None:
+                self._set_label_text(label, text)
+    
+    def _set_label_text(self, label: tk.Label, text: str):
+        """Sets a stats label's text unless it already shows it. The last text applied is kept in
+        _label_texts, so the check needs no cget round trip; stats labels are only written here."""
+        if self._label_texts.get(label) != text:
+            self._label_texts[label] = text
+            label.config(text=text)
     
     def reset_bait(self):
         """Resets the bait counter to max capacity for selected windows, 0 for unselected"""
@@ -2114,22 +2547,21 @@ class BotGUI:
         for bot_id, bot in self.bots.items():
             bot.bait_counter = max_bait
             self.window_stats[bot_id]['bait'] = max_bait
-            self.window_bait_labels[bot_id].config(text=f"B:{max_bait}")
+            self._set_label_text(self.window_bait_labels[bot_id], f"B:{max_bait}")
         
         # Reset stats for all non-running windows
         for i in range(MAX_WINDOWS):
             if i not in self.bots:
-                is_selected = self.window_selections[i].get()
-                if is_selected:
+                if self._window_selected[i]:
                     self.window_stats[i]['bait'] = max_bait
-                    self.window_bait_labels[i].config(text=f"B:{max_bait}")
+                    self._set_label_text(self.window_bait_labels[i], f"B:{max_bait}")
                 else:
                     self.window_stats[i]['bait'] = 0
-                    self.window_bait_labels[i].config(text="B:---")
+                    self._set_label_text(self.window_bait_labels[i], "B:---")
         
         # Update total bait label (sum of all selected windows)
-        total_bait = sum(self.window_stats[i]['bait'] for i in range(MAX_WINDOWS) if self.window_selections[i].get())
-        self.bait_label.config(text=str(total_bait))
+        total_bait = self._total_bait()
+        self._set_label_text(self.bait_label, str(total_bait))
         
         self.add_status(f"All bait counters reset to {max_bait}")
         self.save_config()
@@ -2139,7 +2571,7 @@ class BotGUI:
         if bot_id in self.window_stats:
             self.window_stats[bot_id]['bait'] = new_bait
         if bot_id in self.window_bait_labels:
-            self.window_bait_labels[bot_id].config(text=f"B:{new_bait}")
+            self._set_label_text(self.window_bait_labels[bot_id], f"B:{new_bait}")
         self.save_config()
     
     def start_all_bots(self):
@@ -2159,9 +2591,11 @@ class BotGUI:
                                "Available bait keys: 1, 2, 3, 4, F1, F2, F3, F4")
             return
         
+        # Selected slots, read once from the selection mirror and reused below
+        selected_windows = self._selected_windows()
+        
         # Check if any selected window has 0 bait - force user to reset bait before starting
-        windows_with_no_bait = [i + 1 for i in range(MAX_WINDOWS) 
-                                if self.window_selections[i].get() and self.window_stats[i]['bait'] <= 0]
+        windows_with_no_bait = [i + 1 for i, _ in selected_windows if self.window_stats[i]['bait'] <= 0]
         if windows_with_no_bait:
             window_list = ", ".join(f"W{w}" for w in windows_with_no_bait)
             messagebox.showerror("No Bait", 
@@ -2231,16 +2665,17 @@ class BotGUI:
             self.config['classic_fishing_delay'] = 3.0
         self.save_config()
         
-        # Get all available windows
-        all_windows = WindowManager.get_all_windows()
-        window_dict = {name: win for name, win in all_windows}
+        # Windows by display name (re-enumerated once below if a selection isn't in it, or its
+        # handle is gone - e.g. the client was restarted under the same title)
+        window_dict = self._get_window_map()
+        refreshed = False
         
         # Start a bot for each selected window
         started_count = 0
-        for bot_id in range(MAX_WINDOWS):
-            selected_name = self.window_selections[bot_id].get()
-            if not selected_name:
-                continue
+        for bot_id, selected_name in selected_windows:
+            if not refreshed and not self._window_usable(window_dict, selected_name):
+                window_dict = self._get_window_map(refresh=True)
+                refreshed = True
             
             if selected_name not in window_dict:
                 self.add_status(f"[W{bot_id+1}] Window not found: {selected_name}")
@@ -2268,13 +2703,16 @@ class BotGUI:
                 bait_keys=selected_bait_keys.copy(),
                 bot_id=bot_id
             )
-            bot.on_status_update = self.add_status
+            # Without the status log every message would be dropped by add_status, so leave the
+            # callback unset and the bot skips formatting them (all calls are guarded)
+            bot.on_status_update = self.add_status if DEBUG_MODE_EN else None
             bot.on_stats_update = self.update_stats
             bot.on_bait_update = self.update_bait_from_bot
             bot.on_bot_stop = self.on_bot_stopped
             
             bot.running = True
             self.bots[bot_id] = bot
+            self._running_bot_ids.add(bot_id)
             
             # Initialize stats
             self.window_stats[bot_id] = {'hits': 0, 'games': 0, 'bait': self.bait}
@@ -2285,12 +2723,12 @@ class BotGUI:
                 self.fish_detector_debug_windows[bot_id] = FishDetectorDebugWindow(self.root, bot)
             
             # Start bot thread
-            thread = threading.Thread(target=bot.start, daemon=True)
+            thread = threading.Thread(target=bot.start, daemon=True, name=f"Bot-W{bot_id+1}")
             thread.start()
             self.bot_threads[bot_id] = thread
             
             # Update status indicator
-            self.window_status_labels[bot_id].config(text="🟢", fg="#00ff00")
+            self._set_window_status(bot_id, 'running')
             self.window_combos[bot_id].config(state="disabled")
             
             started_count += 1
@@ -2317,9 +2755,10 @@ class BotGUI:
         for bot_id, bot in list(self.bots.items()):
             bot.running = False
             bot.stop()
-            self.window_status_labels[bot_id].config(text="⚪", fg="#888888")
+            self._set_window_status(bot_id, 'idle')
             self.window_combos[bot_id].config(state="readonly")
         
+        self._running_bot_ids.clear()
         self.bots.clear()
         self.bot_threads.clear()
         
@@ -2353,8 +2792,7 @@ class BotGUI:
             self.stop_all_btn.config(state=tk.DISABLED)
         
         # Update active windows count
-        active_count = len([b for b in self.bots.values() if b.running])
-        self.active_windows_label.config(text=str(active_count))
+        self._set_label_text(self.active_windows_label, str(len(self._running_bot_ids)))
     
     def set_config_widgets_state(self, state: str):
         """Enables or disables all configuration widgets.
@@ -2411,10 +2849,34 @@ class BotGUI:
         if hasattr(self, 'refresh_windows_btn'):
             self.refresh_windows_btn.config(state=state)
     
+    def _make_status_dot(self, color: str) -> tk.PhotoImage:
+        """Draws a filled circle of the given color into a small transparent PhotoImage"""
+        size = self._STATUS_DOT_SIZE
+        image = tk.PhotoImage(master=self.root, width=size, height=size)
+        radius = size / 2
+        for y in range(size):
+            dy = y + 0.5 - radius
+            half = (radius * radius - dy * dy) ** 0.5
+            x0, x1 = int(round(radius - half)), int(round(radius + half))
+            if x1 > x0:
+                image.put(color, to=(x0, y, x1, y + 1))
+        return image
+    
+    def _set_window_status(self, bot_id: int, state: str):
+        """Swaps a window's status dot image (no text re-layout); skips the call if unchanged"""
+        label = self.window_status_labels.get(bot_id)
+        if label is None or self._window_status.get(bot_id) == state:
+            return
+        self._window_status[bot_id] = state
+        label.config(image=self._status_images[state])
+    
     def on_bot_stopped(self, bot_id: int):
         """Updates UI when a bot stops running."""
-        if bot_id in self.window_status_labels:
-            self.window_status_labels[bot_id].config(text="🔴", fg="#e74c3c")
+        self._running_bot_ids.discard(bot_id)
+        # The game client may have closed (or restarted under the same title with a new handle):
+        # drop the window snapshot so the next Start enumerates again instead of reusing it
+        self._window_map = {}
+        self._set_window_status(bot_id, 'stopped')
         if bot_id in self.window_combos:
             self.window_combos[bot_id].config(state="readonly")
         
@@ -2441,7 +2903,7 @@ class BotGUI:
             
             # Play sound alert if all selected windows are out of bait (only once per session)
             if self.config.get('sound_alert_on_finish', True) and not self._sound_alert_played:
-                total_bait = sum(self.window_stats[i]['bait'] for i in range(MAX_WINDOWS) if self.window_selections[i].get())
+                total_bait = self._total_bait()
                 if total_bait <= 0:
                     self._sound_alert_played = True
                     from utils import play_rickroll_beep
@@ -2487,7 +2949,8 @@ class BotGUI:
             except:
                 pass
         
-        self.save_config()
+        # Write synchronously - a save still scheduled with after() would never run
+        self._write_config()
         self.root.destroy()
     
     def copy_btc_address(self):
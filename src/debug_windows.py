@@ -4,8 +4,10 @@ IgnoredPositionsWindow, FishDetectorDebugWindow, and StatusLogWindow
 """
 
 import os
+import threading
 import time
 import tkinter as tk
+from collections import deque
 
 import cv2
 import numpy as np
@@ -15,14 +17,71 @@ from mss import mss
 from utils import get_resource_path, DEBUG_PRINTS
 
 
+def _window_hidden(window) -> bool:
+    """True when a Toplevel is minimized or withdrawn, so capture and rendering can be skipped"""
+    try:
+        return window.state() in ("iconic", "withdrawn")
+    except tk.TclError:
+        return False
+
+
+def _reuse_buffer(buf, shape) -> np.ndarray:
+    """Returns buf if it already has the given shape, otherwise a fresh uint8 array for it"""
+    if buf is None or buf.shape != shape:
+        buf = np.empty(shape, dtype=np.uint8)
+    return buf
+
+
+def _frame_digest(img: np.ndarray) -> int:
+    """Cheap change signature of a preview image: the sum of every 8th pixel in both directions"""
+    return int(img[::8, ::8].sum())
+
+
+def _bgr_photo(img):
+    """PhotoImage straight from a C-contiguous BGR array - PIL's raw decoder swaps the channels,
+    so there's no cvtColor RGB copy or fromarray wrapper"""
+    height, width = img.shape[:2]
+    return ImageTk.PhotoImage(Image.frombuffer("RGB", (width, height), img, "raw", "BGR", 0, 1))
+
+
+def _update_photo(photo, pil_image):
+    """Pastes pil_image into photo while the size stays the same (Tk allocates nothing per frame),
+    otherwise returns a new PhotoImage"""
+    if photo is not None and photo.width() == pil_image.width and photo.height() == pil_image.height:
+        photo.paste(pil_image)
+        return photo
+    return ImageTk.PhotoImage(pil_image)
+
+
+def _show_image(canvas, item, shown, image, x: int, y: int):
+    """Shows image centered at (x, y) on the canvas' single image item. The item is created once
+    and afterwards only repointed with itemconfig when the shown image object changes.
+    Returns the new (item, shown)."""
+    if item is None:
+        canvas.delete("all")
+        item = canvas.create_image(x, y, image=image, anchor="center")
+    elif shown is not image:
+        canvas.itemconfig(item, image=image)
+    return item, image
+
+
 class StatusLogWindow:
     """Separate window for displaying status log messages"""
     
+    # Messages from bot threads go into a ring buffer (the oldest are dropped if the log falls
+    # behind) and are inserted by the Tk thread in batches
+    _QUEUE_SIZE = 256
+    _DRAIN_BATCH = 50
+    _DRAIN_INTERVAL_MS = 50
+    
     def __init__(self, parent):
         self.parent = parent
         self.window = None
         self.status_text = None
+        self._message_queue = deque(maxlen=self._QUEUE_SIZE)
+        self._drain_id = None
         self._create_window()
+        self._drain_id = self.window.after(self._DRAIN_INTERVAL_MS, self._drain_messages)
     
     def _create_window(self):
         """Creates the status log window"""
@@ -93,13 +152,30 @@ class StatusLogWindow:
         self.window.withdraw()
     
     def add_message(self, message: str):
-        """Adds a message to the status log"""
-        if self.status_text:
+        """Queues a message for the status log. Safe to call from any thread; never blocks
+        (deque.append is atomic, no lock or condition variable involved)"""
+        self._message_queue.append(f"[{time.strftime('%H:%M:%S')}] {message}\n")
+    
+    def _drain_messages(self):
+        """Inserts queued messages into the log with a single Text insert (runs on the Tk thread)"""
+        if not self.window:
+            return
+        
+        lines = []
+        popleft = self._message_queue.popleft
+        try:
+            for _ in range(self._DRAIN_BATCH):
+                lines.append(popleft())
+        except IndexError:
+            pass
+        
+        if lines and self.status_text:
             self.status_text.config(state=tk.NORMAL)
-            timestamp = time.strftime("%H:%M:%S")
-            self.status_text.insert(tk.END, f"[{timestamp}] {message}\n")
+            self.status_text.insert(tk.END, "".join(lines))
             self.status_text.see(tk.END)
             self.status_text.config(state=tk.DISABLED)
+        
+        self._drain_id = self.window.after(self._DRAIN_INTERVAL_MS, self._drain_messages)
     
     def clear_log(self):
         """Clears all messages from the log"""
@@ -129,6 +205,9 @@ class StatusLogWindow:
     def destroy(self):
         """Destroys the window"""
         if self.window:
+            if self._drain_id:
+                self.window.after_cancel(self._drain_id)
+                self._drain_id = None
             self.window.destroy()
             self.window = None
 
@@ -143,6 +222,9 @@ class IgnoredPositionsWindow:
         self.canvas = None
         self.photo_image = None
         self.sct = None  # Own screen capture instance (thread-safe)
+        self._frame_buf = None  # BGR capture, drawn on in place
+        self._resize_buf = None  # Canvas-sized copy handed to PIL
+        self._last_digest = None  # (image digest, count) of what the canvas shows
         self._create_window()
         self._update_loop_id = None
     
@@ -188,6 +270,9 @@ class IgnoredPositionsWindow:
         # Store a reference to the placeholder image
         self.placeholder_image = None
         self.photo_image = None
+        self._capture_failed_image = None
+        self._canvas_item = None  # The canvas' one image item (placeholder, photo_image or capture failed)
+        self._shown_image = None  # Image object _canvas_item currently points at
         
         # Draw initial placeholder
         self._draw_placeholder()
@@ -214,13 +299,11 @@ class IgnoredPositionsWindow:
                        cv2.FONT_HERSHEY_SIMPLEX, 0.7, (0, 255, 0), 2)
             
             # Convert and display
-            rgb_frame = cv2.cvtColor(placeholder, cv2.COLOR_BGR2RGB)
-            pil_image = Image.fromarray(rgb_frame)
-            self.placeholder_image = ImageTk.PhotoImage(pil_image)
+            self.placeholder_image = _bgr_photo(placeholder)
             
-            self.canvas.delete("all")
-            self.canvas.create_image(140, 140, image=self.placeholder_image, anchor="center")
-            self.canvas.update()
+            self._canvas_item, self._shown_image = _show_image(self.canvas, self._canvas_item, self._shown_image,
+                                                               self.placeholder_image, 140, 140)
+            self.canvas.update_idletasks()  # Flush the redraw only; update() would run the whole event loop
         except Exception as e:
             from utils import DEBUG_PRINTS
             if DEBUG_PRINTS:
@@ -248,12 +331,23 @@ class IgnoredPositionsWindow:
             if not self.window or not self.window.winfo_exists():
                 return
             
+            # Nothing to show while minimized - skip capture and rendering until restored
+            if _window_hidden(self.window):
+                self._schedule_update()
+                return
+            
             # Only attempt capture if bot has a selected window
             if not self.bot.window_manager or not self.bot.window_manager.selected_window:
                 # Show placeholder
                 if self.placeholder_image:
-                    self.canvas.delete("all")
-                    self.canvas.create_image(140, 140, image=self.placeholder_image, anchor="center")
+                    self._canvas_item, self._shown_image = _show_image(self.canvas, self._canvas_item, self._shown_image,
+                                                                       self.placeholder_image, 140, 140)
+                    self._last_digest = None  # Canvas no longer shows the last frame
+                self._schedule_update()
+                return
+            
+            # A minimized game window only yields garbage pixels - keep the last image
+            if self.bot.window_manager.is_minimized():
                 self._schedule_update()
                 return
             
@@ -273,9 +367,11 @@ class IgnoredPositionsWindow:
                     "height": max(0, win_height - self.bot._inventory_y_offset - 30)
                 }
                 
+                # BGRA view of the grab converted into the reused BGR buffer
                 sct_img = self.sct.grab(monitor)
-                inventory_frame = np.array(sct_img)
-                inventory_frame = cv2.cvtColor(inventory_frame, cv2.COLOR_BGRA2BGR)
+                bgra = np.asarray(sct_img)
+                self._frame_buf = _reuse_buffer(self._frame_buf, bgra.shape[:2] + (3,))
+                inventory_frame = cv2.cvtColor(bgra, cv2.COLOR_BGRA2BGR, dst=self._frame_buf)
                 
             except Exception as e:
                 if DEBUG_PRINTS:
@@ -309,19 +405,19 @@ class IgnoredPositionsWindow:
                 # Captured image is completely black - likely capturing wrong area
                 if DEBUG_PRINTS:
                     print(f"DEBUG: Image is black, showing test pattern instead")
-                # Create test pattern to show capture coordinates
-                test_img = np.zeros((280, 280, 3), dtype=np.uint8)
-                test_img[:] = (100, 50, 50)  # Dark red
-                cv2.putText(test_img, "Capture failed", (40, 120), 
-                           cv2.FONT_HERSHEY_SIMPLEX, 0.7, (0, 255, 255), 2)
-                cv2.putText(test_img, "Check window", (50, 160), 
-                           cv2.FONT_HERSHEY_SIMPLEX, 0.6, (0, 255, 255), 2)
-                rgb_test = cv2.cvtColor(test_img, cv2.COLOR_BGR2RGB)
-                pil_test = Image.fromarray(rgb_test)
-                self.photo_image = ImageTk.PhotoImage(pil_test)
-                self.canvas.delete("all")
-                self.canvas.create_image(140, 140, image=self.photo_image, anchor="center")
-                self.canvas.update()
+                # Test pattern to show capture coordinates (built once - it stays up every tick while capture fails)
+                if self._capture_failed_image is None:
+                    test_img = np.zeros((280, 280, 3), dtype=np.uint8)
+                    test_img[:] = (100, 50, 50)  # Dark red
+                    cv2.putText(test_img, "Capture failed", (40, 120), 
+                               cv2.FONT_HERSHEY_SIMPLEX, 0.7, (0, 255, 255), 2)
+                    cv2.putText(test_img, "Check window", (50, 160), 
+                               cv2.FONT_HERSHEY_SIMPLEX, 0.6, (0, 255, 255), 2)
+                    self._capture_failed_image = _bgr_photo(test_img)
+                self._canvas_item, self._shown_image = _show_image(self.canvas, self._canvas_item, self._shown_image,
+                                                                   self._capture_failed_image, 140, 140)
+                self._last_digest = None  # Canvas no longer shows the last frame
+                self.canvas.update_idletasks()
                 self._schedule_update()
                 return
             
@@ -332,8 +428,8 @@ class IgnoredPositionsWindow:
                 self._schedule_update()
                 return
             
-            # Create visualization - make a copy to draw on
-            viz_frame = inventory_frame.copy()
+            # Draw straight onto the capture buffer (refilled every tick, no copy needed)
+            viz_frame = inventory_frame
             
             # Draw circles for each ignored position
             for ix, iy in self.bot._ignored_positions:
@@ -350,26 +446,29 @@ class IgnoredPositionsWindow:
             new_h = int(inv_h * scale)
             
             if new_w > 0 and new_h > 0:
-                viz_resized = cv2.resize(viz_frame, (new_w, new_h), interpolation=cv2.INTER_LINEAR)
+                self._resize_buf = _reuse_buffer(self._resize_buf, (new_h, new_w, 3))
+                viz_resized = cv2.resize(viz_frame, (new_w, new_h), dst=self._resize_buf, interpolation=cv2.INTER_LINEAR)
             else:
                 self._schedule_update()
                 return
             
-            # Convert to RGB
-            rgb_frame = cv2.cvtColor(viz_resized, cv2.COLOR_BGR2RGB)
-            
-            # Create PIL image
-            pil_image = Image.fromarray(rgb_frame)
+            # Steady inventory: the canvas and counter already show this, skip the Tk work
+            count = len(self.bot._ignored_positions)
+            digest = (_frame_digest(viz_resized), count)
+            if digest == self._last_digest:
+                self._schedule_update()
+                return
+            self._last_digest = digest
             
-            # Create PhotoImage and store it
-            self.photo_image = ImageTk.PhotoImage(pil_image)
+            # PIL image from the BGR buffer - the raw decoder swaps channels, no RGB intermediate
+            pil_image = Image.frombuffer("RGB", (new_w, new_h), viz_resized, "raw", "BGR", 0, 1)
             
-            # Update canvas
-            self.canvas.delete("all")
-            self.canvas.create_image(140, 140, image=self.photo_image, anchor="center")
+            # Update canvas (pastes into the existing PhotoImage when the size is unchanged)
+            self.photo_image = _update_photo(self.photo_image, pil_image)
+            self._canvas_item, self._shown_image = _show_image(self.canvas, self._canvas_item, self._shown_image,
+                                                               self.photo_image, 140, 140)
             
             # Update counter
-            count = len(self.bot._ignored_positions)
             self.counter_label.config(text=f"Count: {count}")
             
         except Exception as e:
@@ -411,6 +510,50 @@ class IgnoredPositionsWindow:
 class FishDetectorDebugWindow:
     """Debug window for visualizing fish detection (window bounds and fish position)"""
     
+    # Glyph masks for constant labels, rendered once: (text, font_scale, thickness) -> (mask, pad, text_h)
+    # Labels with a slowly changing value (window size) also go through here, so the cache is bounded
+    _label_sprites = {}
+    _LABEL_SPRITES_MAX = 64
+    
+    # Capture + detection run on a worker thread; the Tk loop only picks up finished frames
+    _CAPTURE_INTERVAL = 0.2
+    _POLL_MS = 50
+    
+    # Frames costing more than the interval stretch it to twice their cost, between 2 FPS and a
+    # minimum sleep, so a slow render never runs back-to-back against the bot threads
+    _CAPTURE_INTERVAL_MAX = 0.5
+    _MIN_SLEEP = 0.02
+    
+    @staticmethod
+    def _draw_label(img, text, org, font_scale, color, thickness):
+        """Draws a constant label exactly like cv2.putText (FONT_HERSHEY_SIMPLEX), but from a
+        cached glyph mask so the text is rasterized only once"""
+        key = (text, font_scale, thickness)
+        sprite = FishDetectorDebugWindow._label_sprites.get(key)
+        if sprite is None:
+            (text_w, text_h), baseline = cv2.getTextSize(text, cv2.FONT_HERSHEY_SIMPLEX, font_scale, thickness)
+            pad = thickness + 1
+            mask = np.zeros((text_h + baseline + 2 * pad, text_w + 2 * pad), dtype=np.uint8)
+            cv2.putText(mask, text, (pad, text_h + pad), cv2.FONT_HERSHEY_SIMPLEX, font_scale, 255, thickness)
+            sprite = (mask.astype(bool), pad, text_h)
+            if len(FishDetectorDebugWindow._label_sprites) >= FishDetectorDebugWindow._LABEL_SPRITES_MAX:
+                FishDetectorDebugWindow._label_sprites.clear()
+            FishDetectorDebugWindow._label_sprites[key] = sprite
+        
+        mask, pad, text_h = sprite
+        x0 = org[0] - pad
+        y0 = org[1] - text_h - pad
+        
+        # Clip the sprite against the image borders
+        img_h, img_w = img.shape[:2]
+        mask_h, mask_w = mask.shape
+        sx0, sy0 = max(0, -x0), max(0, -y0)
+        sx1, sy1 = min(mask_w, img_w - x0), min(mask_h, img_h - y0)
+        if sx0 >= sx1 or sy0 >= sy1:
+            return
+        roi = img[y0 + sy0:y0 + sy1, x0 + sx0:x0 + sx1]
+        roi[mask[sy0:sy1, sx0:sx1]] = color
+    
     def __init__(self, parent, bot_instance):
         self.parent = parent
         self.bot = bot_instance
@@ -418,9 +561,20 @@ class FishDetectorDebugWindow:
         self.canvas = None
         self.photo_image = None
         self.sct = None  # Own screen capture instance (thread-safe)
+        self._frame_buf = None  # BGR capture, drawn on in place
+        self._resize_buf = None  # Canvas-sized copy handed to PIL
         self.status_label = None
+        self._latest = None  # Newest worker result, taken by _update_display
+        self._latest_lock = threading.Lock()
+        self._worker_active = False
+        self._worker_idle = False  # Set by the Tk loop while this window is hidden
+        self._worker_thread = None
+        self._last_digest = None  # (image digest, status, info) of the last published frame
+        self._shown_status = None  # Texts currently on status_label / info_text
+        self._shown_info = None
         self._create_window()
         self._update_loop_id = None
+        self._start_worker()
     
     def _create_window(self):
         """Creates the fish detector debug window"""
@@ -484,6 +638,8 @@ class FishDetectorDebugWindow:
         # Store a reference to the placeholder image
         self.placeholder_image = None
         self.photo_image = None
+        self._canvas_item = None  # The canvas' one image item (placeholder or photo_image)
+        self._shown_image = None  # Image object _canvas_item currently points at
         
         # Draw initial placeholder
         self._draw_placeholder()
@@ -503,23 +659,22 @@ class FishDetectorDebugWindow:
             cv2.putText(placeholder, "Waiting for detection...", (80, 180), 
                        cv2.FONT_HERSHEY_SIMPLEX, 0.9, (0, 255, 0), 2)
             
-            rgb_frame = cv2.cvtColor(placeholder, cv2.COLOR_BGR2RGB)
-            pil_image = Image.fromarray(rgb_frame)
-            self.placeholder_image = ImageTk.PhotoImage(pil_image)
+            self.placeholder_image = _bgr_photo(placeholder)
             
-            self.canvas.delete("all")
-            self.canvas.create_image(280, 190, image=self.placeholder_image, anchor="center")
-            self.canvas.update()
+            self._canvas_item, self._shown_image = _show_image(self.canvas, self._canvas_item, self._shown_image,
+                                                               self.placeholder_image, 280, 190)
+            self.canvas.update_idletasks()
         except Exception as e:
             pass
     
     def _schedule_update(self):
         """Schedule next update"""
         if self.window and self.window.winfo_exists():
-            self._update_loop_id = self.window.after(200, self._update_display)
+            self._update_loop_id = self.window.after(self._POLL_MS, self._update_display)
     
     def _on_close(self):
         """Handle window close"""
+        self._worker_active = False
         if self._update_loop_id:
             self.window.after_cancel(self._update_loop_id)
         if self.window:
@@ -527,239 +682,295 @@ class FishDetectorDebugWindow:
             self.window = None
     
     def _update_display(self):
-        """Update the detection visualization"""
+        """Pushes the worker's newest result to the canvas (Tk thread only)"""
         try:
             if not self.window or not self.window.winfo_exists():
                 return
             
-            # Only attempt capture if bot has a selected window
-            if not self.bot.window_manager or not self.bot.window_manager.selected_window:
-                if self.placeholder_image:
-                    self.canvas.delete("all")
-                    self.canvas.create_image(280, 190, image=self.placeholder_image, anchor="center")
-                self.status_label.config(text="Status: No window selected")
-                self._schedule_update()
-                return
-            
-            # Initialize mss if needed
-            if self.sct is None:
-                self.sct = mss()
+            # Nothing to show while minimized - the worker skips capture, detection and rendering until restored
+            self._worker_idle = _window_hidden(self.window)
+            
+            with self._latest_lock:
+                result = self._latest
+                self._latest = None
+            
+            if result is not None:
+                status, info, pil_image, placeholder = result
+                if placeholder and self.placeholder_image:
+                    self._canvas_item, self._shown_image = _show_image(self.canvas, self._canvas_item, self._shown_image,
+                                                                       self.placeholder_image, 280, 190)
+                if pil_image is not None:
+                    # PhotoImage talks to Tk, so it is the one step that has to happen here
+                    self.photo_image = _update_photo(self.photo_image, pil_image)
+                    self._canvas_item, self._shown_image = _show_image(self.canvas, self._canvas_item, self._shown_image,
+                                                                       self.photo_image, 280, 190)
+                # Labels are reconfigured only when their text changes (it often doesn't between frames)
+                if status != self._shown_status:
+                    self.status_label.config(text=status)
+                    self._shown_status = status
+                if info is not None and info != self._shown_info:
+                    self.info_text.config(text=info)
+                    self._shown_info = info
             
-            # Capture full window
-            try:
-                win_left, win_top, win_width, win_height = self.bot.window_manager.get_window_rect()
-                
-                monitor = {
-                    "left": win_left,
-                    "top": win_top,
-                    "width": win_width,
-                    "height": win_height
-                }
-                
-                sct_img = self.sct.grab(monitor)
-                frame = np.array(sct_img)
-                frame = cv2.cvtColor(frame, cv2.COLOR_BGRA2BGR)
+        except Exception as e:
+            self.status_label.config(text=f"Status: ERROR")
+            self._shown_status = None
+        
+        self._schedule_update()
+    
+    def _start_worker(self):
+        """Starts the capture/detection thread that feeds _update_display"""
+        self._worker_active = True
+        self._worker_thread = threading.Thread(target=self._render_worker, daemon=True,
+                                               name=f"FishDebug-W{self.bot.bot_id+1}")
+        self._worker_thread.start()
+    
+    def _render_worker(self):
+        """Worker loop: captures, runs detection and draws the overlays every _CAPTURE_INTERVAL
+        (longer while frames are expensive), keeping only the newest result (a slow Tk loop drops frames instead of queueing them).
+        Owns the mss instance since mss handles are not shared across threads."""
+        try:
+            self.sct = mss()
+            while self._worker_active:
+                frame_start = time.perf_counter()
+                if not self._worker_idle:
+                    try:
+                        result = self._render_frame()
+                    except Exception as e:
+                        if DEBUG_PRINTS:
+                            print(f"Fish detector debug render error: {e}")
+                        result = ("Status: ERROR", None, None, False)
+                    if result is not None:
+                        if result[2] is None:
+                            self._last_digest = None  # Text-only result, the next frame must be redrawn
+                        with self._latest_lock:
+                            self._latest = result
                 
-            except Exception as e:
-                self.status_label.config(text=f"Status: Capture failed - {str(e)[:40]}")
-                self._schedule_update()
-                return
+                cost = time.perf_counter() - frame_start
+                interval = min(max(self._CAPTURE_INTERVAL, 2.0 * cost), self._CAPTURE_INTERVAL_MAX)
+                time.sleep(max(interval - cost, self._MIN_SLEEP))
+        except Exception as e:
+            with self._latest_lock:
+                self._latest = (f"Status: Capture failed - {str(e)[:40]}", None, None, False)
+        finally:
+            if self.sct is not None:
+                try:
+                    self.sct.close()
+                except Exception:
+                    pass
+                self.sct = None
+    
+    def _render_frame(self):
+        """Captures the game window, runs detection and draws the visualization.
+        Returns (status_text, info_text or None, PIL image or None, show_placeholder),
+        or None when the frame looks the same as the last one published."""
+        # Only attempt capture if bot has a selected window
+        if not self.bot.window_manager or not self.bot.window_manager.selected_window:
+            return ("Status: No window selected", None, None, True)
+        
+        # Same for the game window itself: nothing worth detecting while it is minimized
+        if self.bot.window_manager.is_minimized():
+            return ("Status: Game window minimized", None, None, False)
+        
+        # Capture full window
+        try:
+            win_left, win_top, win_width, win_height = self.bot.window_manager.get_window_rect()
             
-            if frame is None or frame.size == 0:
-                self.status_label.config(text="Status: Invalid frame")
-                self._schedule_update()
-                return
+            monitor = {
+                "left": win_left,
+                "top": win_top,
+                "width": win_width,
+                "height": win_height
+            }
             
-            # Run detections
-            viz_frame = frame.copy()
-            h, w = frame.shape[:2]
+            sct_img = self.sct.grab(monitor)
+            bgra = np.asarray(sct_img)
+            self._frame_buf = _reuse_buffer(self._frame_buf, bgra.shape[:2] + (3,))
+            frame = cv2.cvtColor(bgra, cv2.COLOR_BGRA2BGR, dst=self._frame_buf)
             
-            try:
-                # Draw results on visualization
-                status_msg = []
+        except Exception as e:
+            return (f"Status: Capture failed - {str(e)[:40]}", None, None, False)
+        
+        if frame is None or frame.size == 0:
+            return ("Status: Invalid frame", None, None, False)
+        
+        # Run detections, then draw straight onto the captured frame (it's ours, no copy needed);
+        # every overlay is drawn only after the detectors have read the frame
+        viz_frame = frame
+        h, w = frame.shape[:2]
+        
+        try:
+            # Draw results on visualization
+            status_msg = []
+            
+            # Check which fishing mode is active
+            is_classic_mode = self.bot.config.get('classic_fishing', False)
+            
+            if not is_classic_mode:
+                # ========== MINIGAME MODE DETECTION ==========
+                # Detection 1: find_fishing_window_bounds
+                window_bounds = self.bot.detector.find_fishing_window_bounds(frame)
                 
-                # Check which fishing mode is active
-                is_classic_mode = self.bot.config.get('classic_fishing', False)
+                # Detection 2: detect_window_and_fish
+                window_active, fish_pos = self.bot.detector.detect_window_and_fish(frame)
                 
-                # Show fishing mode status in top-right
-                if is_classic_mode:
-                    cv2.putText(viz_frame, "MODE: CLASSIC", (w - 180, 40),
-                               cv2.FONT_HERSHEY_SIMPLEX, 0.7, (255, 0, 255), 2)
+                # Draw window bounds if found
+                if window_bounds:
+                    x, y, bw, bh = window_bounds
+                    cv2.rectangle(viz_frame, (x, y), (x + bw, y + bh), (0, 255, 0), 3)
+                    # Size only changes when the game window is resized - cached like a constant
+                    self._draw_label(viz_frame, f"Window: {bw}x{bh}", (x, y - 5), 0.6, (0, 255, 0), 2)
+                    status_msg.append(f"Window bounds: ({x}, {y}) {bw}x{bh}")
                 else:
-                    cv2.putText(viz_frame, "MODE: MINIGAME", (w - 180, 40),
-                               cv2.FONT_HERSHEY_SIMPLEX, 0.7, (0, 255, 255), 2)
+                    status_msg.append("Window bounds: NOT FOUND")
+                
+                # Draw window active status
+                if window_active:
+                    self._draw_label(viz_frame, "WINDOW ACTIVE", (20, 40), 0.8, (0, 255, 0), 2)
+                    status_msg.append("Window active: YES")
+                else:
+                    self._draw_label(viz_frame, "WINDOW INACTIVE", (20, 40), 0.8, (0, 0, 255), 2)
+                    status_msg.append("Window active: NO")
                 
-                if not is_classic_mode:
-                    # ========== MINIGAME MODE DETECTION ==========
-                    # Detection 1: find_fishing_window_bounds
-                    window_bounds = self.bot.detector.find_fishing_window_bounds(frame)
+                # Draw fish position if detected
+                if fish_pos:
+                    fx, fy = fish_pos
+                    cv2.circle(viz_frame, (fx, fy), 12, (0, 0, 255), 2)
+                    cv2.circle(viz_frame, (fx, fy), 3, (255, 255, 255), -1)
+                    cv2.putText(viz_frame, f"Fish ({fx},{fy})", (fx + 15, fy - 5),
+                               cv2.FONT_HERSHEY_SIMPLEX, 0.6, (0, 0, 255), 2)
+                    status_msg.append(f"Fish position: ({fx}, {fy})")
+                else:
+                    status_msg.append("Fish position: NOT DETECTED")
+                
+                # Draw circle region if region is calibrated
+                if self.bot.region and self.bot.region_auto_calibrated:
+                    cx = self.bot.region.left + self.bot.region.width // 2
+                    cy = self.bot.region.top + self.bot.region.height // 2
+                    radius = self.bot._circle_radius
+                    cv2.circle(viz_frame, (cx, cy), radius, (255, 255, 0), 2)
+                    self._draw_label(viz_frame, "Click zone", (cx - 40, cy - radius - 10), 0.5, (255, 255, 0), 1)
                     
-                    # Detection 2: detect_window_and_fish
-                    window_active, fish_pos = self.bot.detector.detect_window_and_fish(frame)
+                    # Same squared-distance test the bot uses before clicking
+                    if fish_pos:
+                        dx, dy = fish_pos[0] - cx, fish_pos[1] - cy
+                        in_zone = (dx * dx + dy * dy) < self.bot._circle_radius_sq
+                        status_msg.append(f"Fish in click zone: {'YES' if in_zone else 'NO'}")
+            
+            else:
+                # ========== CLASSIC FISHING MODE DETECTION ==========
+                # Load classic fish template if available
+                template = self.bot._load_classic_fish_template()
+                if template is not None:
+                    frame_gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
+                    t_h, t_w = template.shape
+                    f_h, f_w = frame_gray.shape
                     
-                    # Draw window bounds if found
-                    if window_bounds:
-                        x, y, bw, bh = window_bounds
-                        cv2.rectangle(viz_frame, (x, y), (x + bw, y + bh), (0, 255, 0), 3)
-                        cv2.putText(viz_frame, f"Window: {bw}x{bh}", (x, y - 5),
-                                   cv2.FONT_HERSHEY_SIMPLEX, 0.6, (0, 255, 0), 2)
-                        status_msg.append(f"Window bounds: ({x}, {y}) {bw}x{bh}")
-                    else:
-                        status_msg.append("Window bounds: NOT FOUND")
+                    # Crop to 250px wide centered bar, upper half only (same as detection)
+                    center_x = f_w // 2
+                    crop_left = max(0, center_x - 125)
+                    crop_right = min(f_w, center_x + 125)
+                    crop_bottom = f_h // 2  # Only upper half
+                    frame_gray_cropped = frame_gray[:crop_bottom, crop_left:crop_right]
                     
-                    # Draw window active status
-                    if window_active:
-                        cv2.putText(viz_frame, "WINDOW ACTIVE", (20, 40),
-                                   cv2.FONT_HERSHEY_SIMPLEX, 0.8, (0, 255, 0), 2)
-                        status_msg.append("Window active: YES")
-                    else:
-                        cv2.putText(viz_frame, "WINDOW INACTIVE", (20, 40),
-                                   cv2.FONT_HERSHEY_SIMPLEX, 0.8, (0, 0, 255), 2)
-                        status_msg.append("Window active: NO")
+                    # Draw the search region on viz_frame (in place - frame_gray was taken above)
+                    overlay = viz_frame
+                    # Darken areas outside the search region
+                    overlay[:, :crop_left] = (overlay[:, :crop_left] * 0.3).astype(np.uint8)
+                    overlay[:, crop_right:] = (overlay[:, crop_right:] * 0.3).astype(np.uint8)
+                    overlay[crop_bottom:, :] = (overlay[crop_bottom:, :] * 0.3).astype(np.uint8)  # Darken lower half
+                    # Draw lines to mark search region
+                    cv2.line(overlay, (crop_left, 0), (crop_left, crop_bottom), (0, 255, 255), 2)
+                    cv2.line(overlay, (crop_right, 0), (crop_right, crop_bottom), (0, 255, 255), 2)
+                    cv2.line(overlay, (crop_left, crop_bottom), (crop_right, crop_bottom), (0, 255, 255), 2)  # Bottom line
+                    self._draw_label(overlay, "Search region (250px, upper, multi-scale)", (crop_left + 5, 25), 0.4, (0, 255, 255), 1)
+                    viz_frame = overlay
                     
-                    # Draw fish position if detected
-                    if fish_pos:
-                        fx, fy = fish_pos
-                        cv2.circle(viz_frame, (fx, fy), 12, (0, 0, 255), 2)
-                        cv2.circle(viz_frame, (fx, fy), 3, (255, 255, 255), -1)
-                        cv2.putText(viz_frame, f"Fish ({fx},{fy})", (fx + 15, fy - 5),
-                                   cv2.FONT_HERSHEY_SIMPLEX, 0.6, (0, 0, 255), 2)
-                        status_msg.append(f"Fish position: ({fx}, {fy})")
-                    else:
-                        status_msg.append("Fish position: NOT DETECTED")
+                    f_h_cropped, f_w_cropped = frame_gray_cropped.shape
                     
-                    # Draw circle region if region is calibrated
-                    if self.bot.region and self.bot.region_auto_calibrated:
-                        cx = self.bot.region.left + self.bot.region.width // 2
-                        cy = self.bot.region.top + self.bot.region.height // 2
-                        radius = 67
-                        cv2.circle(viz_frame, (cx, cy), radius, (255, 255, 0), 2)
-                        cv2.putText(viz_frame, "Click zone", (cx - 40, cy - radius - 10),
-                                   cv2.FONT_HERSHEY_SIMPLEX, 0.5, (255, 255, 0), 1)
-                
-                else:
-                    # ========== CLASSIC FISHING MODE DETECTION ==========
-                    # Load classic fish template if available
-                    template = self.bot._load_classic_fish_template()
-                    if template is not None:
-                        frame_gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
-                        t_h, t_w = template.shape
-                        f_h, f_w = frame_gray.shape
-                        
-                        # Crop to 250px wide centered bar, upper half only (same as detection)
-                        center_x = f_w // 2
-                        crop_left = max(0, center_x - 125)
-                        crop_right = min(f_w, center_x + 125)
-                        crop_bottom = f_h // 2  # Only upper half
-                        frame_gray_cropped = frame_gray[:crop_bottom, crop_left:crop_right]
-                        
-                        # Draw the search region on viz_frame (semi-transparent overlay)
-                        overlay = viz_frame.copy()
-                        # Darken areas outside the search region
-                        overlay[:, :crop_left] = (overlay[:, :crop_left] * 0.3).astype(np.uint8)
-                        overlay[:, crop_right:] = (overlay[:, crop_right:] * 0.3).astype(np.uint8)
-                        overlay[crop_bottom:, :] = (overlay[crop_bottom:, :] * 0.3).astype(np.uint8)  # Darken lower half
-                        # Draw lines to mark search region
-                        cv2.line(overlay, (crop_left, 0), (crop_left, crop_bottom), (0, 255, 255), 2)
-                        cv2.line(overlay, (crop_right, 0), (crop_right, crop_bottom), (0, 255, 255), 2)
-                        cv2.line(overlay, (crop_left, crop_bottom), (crop_right, crop_bottom), (0, 255, 255), 2)  # Bottom line
-                        cv2.putText(overlay, "Search region (250px, upper, multi-scale)", (crop_left + 5, 25),
-                                   cv2.FONT_HERSHEY_SIMPLEX, 0.4, (0, 255, 255), 1)
-                        viz_frame = overlay
+                    # Multi-scale template matching (same as detection code)
+                    scales = [0.25, 0.3, 0.35, 0.4, 0.45, 0.5, 0.6, 0.7, 0.8, 0.9, 1.0, 1.2, 1.4, 1.6, 1.8, 2.0, 2.25, 2.5, 2.75, 3.0]
+                    best_match_val = 0
+                    best_scale = 1.0
+                    best_loc = (0, 0)
+                    best_size = (t_w, t_h)
+                    
+                    for scale in scales:
+                        new_w = int(t_w * scale)
+                        new_h = int(t_h * scale)
                         
-                        f_h_cropped, f_w_cropped = frame_gray_cropped.shape
+                        if new_h > f_h_cropped or new_w > f_w_cropped or new_w < 10 or new_h < 10:
+                            continue
                         
-                        # Multi-scale template matching (same as detection code)
-                        scales = [0.25, 0.3, 0.35, 0.4, 0.45, 0.5, 0.6, 0.7, 0.8, 0.9, 1.0, 1.2, 1.4, 1.6, 1.8, 2.0, 2.25, 2.5, 2.75, 3.0]
-                        best_match_val = 0
-                        best_scale = 1.0
-                        best_loc = (0, 0)
-                        best_size = (t_w, t_h)
+                        scaled_template = cv2.resize(template, (new_w, new_h), interpolation=cv2.INTER_AREA if scale < 1 else cv2.INTER_LINEAR)
+                        result = cv2.matchTemplate(frame_gray_cropped, scaled_template, cv2.TM_CCOEFF_NORMED)
+                        _, max_val, _, max_loc = cv2.minMaxLoc(result)
                         
-                        for scale in scales:
-                            new_w = int(t_w * scale)
-                            new_h = int(t_h * scale)
-                            
-                            if new_h > f_h_cropped or new_w > f_w_cropped or new_w < 10 or new_h < 10:
-                                continue
-                            
-                            scaled_template = cv2.resize(template, (new_w, new_h), interpolation=cv2.INTER_AREA if scale < 1 else cv2.INTER_LINEAR)
-                            result = cv2.matchTemplate(frame_gray_cropped, scaled_template, cv2.TM_CCOEFF_NORMED)
-                            _, max_val, _, max_loc = cv2.minMaxLoc(result)
-                            
-                            if max_val > best_match_val:
-                                best_match_val = max_val
-                                best_scale = scale
-                                best_loc = max_loc
-                                best_size = (new_w, new_h)
-                            
-                            if max_val >= 0.8:
-                                break
+                        if max_val > best_match_val:
+                            best_match_val = max_val
+                            best_scale = scale
+                            best_loc = max_loc
+                            best_size = (new_w, new_h)
                         
-                        if best_match_val >= 0.7:
-                            # Draw rectangle around detected classic fish (adjust x for crop offset)
-                            pt1 = (best_loc[0] + crop_left, best_loc[1])
-                            pt2 = (best_loc[0] + crop_left + best_size[0], best_loc[1] + best_size[1])
-                            cv2.rectangle(viz_frame, pt1, pt2, (255, 0, 255), 3)  # Magenta
-                            cv2.putText(viz_frame, f"CLASSIC FISH DETECTED!", 
-                                       (pt1[0], pt1[1] - 30),
-                                       cv2.FONT_HERSHEY_SIMPLEX, 0.8, (255, 0, 255), 2)
-                            cv2.putText(viz_frame, f"Conf: {best_match_val:.2f}, Scale: {best_scale:.1f}x", 
-                                       (pt1[0], pt1[1] - 10),
-                                       cv2.FONT_HERSHEY_SIMPLEX, 0.5, (255, 0, 255), 2)
-                            status_msg.append(f"Classic fish: DETECTED ({best_match_val:.2f}, {best_scale:.1f}x)")
-                        else:
-                            # Show confidence while searching
-                            cv2.putText(viz_frame, f"Searching (multi-scale 0.5x-1.5x)...", (20, 40),
-                                       cv2.FONT_HERSHEY_SIMPLEX, 0.6, (128, 128, 128), 2)
-                            cv2.putText(viz_frame, f"Best: {best_match_val:.2f} @ {best_scale:.1f}x (need 0.70)", (20, 70),
-                                       cv2.FONT_HERSHEY_SIMPLEX, 0.5, (128, 128, 128), 2)
-                            status_msg.append(f"Classic fish: searching ({best_match_val:.2f})")
+                        if max_val >= 0.8:
+                            break
+                    
+                    if best_match_val >= 0.7:
+                        # Draw rectangle around detected classic fish (adjust x for crop offset)
+                        pt1 = (best_loc[0] + crop_left, best_loc[1])
+                        pt2 = (best_loc[0] + crop_left + best_size[0], best_loc[1] + best_size[1])
+                        cv2.rectangle(viz_frame, pt1, pt2, (255, 0, 255), 3)  # Magenta
+                        self._draw_label(viz_frame, "CLASSIC FISH DETECTED!", (pt1[0], pt1[1] - 30), 0.8, (255, 0, 255), 2)
+                        cv2.putText(viz_frame, f"Conf: {best_match_val:.2f}, Scale: {best_scale:.1f}x", 
+                                   (pt1[0], pt1[1] - 10),
+                                   cv2.FONT_HERSHEY_SIMPLEX, 0.5, (255, 0, 255), 2)
+                        status_msg.append(f"Classic fish: DETECTED ({best_match_val:.2f}, {best_scale:.1f}x)")
                     else:
-                        cv2.putText(viz_frame, "NO CLASSIC FISH TEMPLATE!", (20, 40),
-                                   cv2.FONT_HERSHEY_SIMPLEX, 0.8, (0, 0, 255), 2)
-                        cv2.putText(viz_frame, "Add assets/classic_fish.jpg", (20, 70),
-                                   cv2.FONT_HERSHEY_SIMPLEX, 0.6, (0, 0, 255), 2)
-                        status_msg.append("Classic fish: NO TEMPLATE")
-                
-                self.status_label.config(text=f"Status: {' | '.join(status_msg[:2])}")
-                
-            except Exception as e:
-                status_msg = [f"Detection error: {str(e)[:50]}"]
-                self.status_label.config(text=f"Status: ERROR - {str(e)[:40]}")
-            
-            # Resize to fit canvas
-            scale = min(560.0 / w, 380.0 / h, 1.0)
-            new_w = int(w * scale)
-            new_h = int(h * scale)
+                        # Show confidence while searching
+                        self._draw_label(viz_frame, "Searching (multi-scale 0.5x-1.5x)...", (20, 40), 0.6, (128, 128, 128), 2)
+                        cv2.putText(viz_frame, f"Best: {best_match_val:.2f} @ {best_scale:.1f}x (need 0.70)", (20, 70),
+                                   cv2.FONT_HERSHEY_SIMPLEX, 0.5, (128, 128, 128), 2)
+                        status_msg.append(f"Classic fish: searching ({best_match_val:.2f})")
+                else:
+                    self._draw_label(viz_frame, "NO CLASSIC FISH TEMPLATE!", (20, 40), 0.8, (0, 0, 255), 2)
+                    self._draw_label(viz_frame, "Add assets/classic_fish.jpg", (20, 70), 0.6, (0, 0, 255), 2)
+                    status_msg.append("Classic fish: NO TEMPLATE")
             
-            if new_w > 0 and new_h > 0:
-                viz_resized = cv2.resize(viz_frame, (new_w, new_h), interpolation=cv2.INTER_LINEAR)
+            # Show fishing mode status in top-right
+            if is_classic_mode:
+                self._draw_label(viz_frame, "MODE: CLASSIC", (w - 180, 40), 0.7, (255, 0, 255), 2)
             else:
-                self._schedule_update()
-                return
-            
-            # Convert to RGB
-            rgb_frame = cv2.cvtColor(viz_resized, cv2.COLOR_BGR2RGB)
-            
-            # Create PIL image
-            pil_image = Image.fromarray(rgb_frame)
-            
-            # Create PhotoImage
-            self.photo_image = ImageTk.PhotoImage(pil_image)
-            
-            # Update canvas
-            self.canvas.delete("all")
-            self.canvas.create_image(280, 190, image=self.photo_image, anchor="center")
+                self._draw_label(viz_frame, "MODE: MINIGAME", (w - 180, 40), 0.7, (0, 255, 255), 2)
             
-            # Update info panel
-            info_str = " | ".join(status_msg)
-            self.info_text.config(text=info_str)
+            status = f"Status: {' | '.join(status_msg[:2])}"
             
         except Exception as e:
-            self.status_label.config(text=f"Status: ERROR")
+            status_msg = [f"Detection error: {str(e)[:50]}"]
+            status = f"Status: ERROR - {str(e)[:40]}"
         
-        self._schedule_update()
+        # Resize to fit canvas
+        scale = min(560.0 / w, 380.0 / h, 1.0)
+        new_w = int(w * scale)
+        new_h = int(h * scale)
+        
+        if new_w <= 0 or new_h <= 0:
+            return (status, None, None, False)
+        
+        self._resize_buf = _reuse_buffer(self._resize_buf, (new_h, new_w, 3))
+        viz_resized = cv2.resize(viz_frame, (new_w, new_h), dst=self._resize_buf, interpolation=cv2.INTER_LINEAR)
+        
+        # Steady scene: nothing to hand to Tk (no PIL image, PhotoImage or label updates)
+        info = " | ".join(status_msg)
+        digest = (_frame_digest(viz_resized), status, info)
+        if digest == self._last_digest:
+            return None
+        self._last_digest = digest
+        
+        # Create PIL image straight from the BGR buffer (PIL swaps channels while unpacking into
+        # its own memory, no separate BGR2RGB pass, and the resize buffer is free to reuse)
+        pil_image = Image.frombuffer("RGB", (new_w, new_h), viz_resized, "raw", "BGR", 0, 1)
+        
+        return (status, info, pil_image, False)
     
     def show(self):
         """Show the window"""
@@ -781,6 +992,7 @@ class FishDetectorDebugWindow:
     
     def destroy(self):
         """Destroy the window"""
+        self._worker_active = False
         if self._update_loop_id:
             self.window.after_cancel(self._update_loop_id)
         if self.window:
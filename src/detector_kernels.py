@@ -0,0 +1,124 @@
+"""
+Optional Numba kernels for the Fish Detector
+Fused single-pass versions of the OpenCV pipeline; every kernel is None when numba isn't installed
+"""
+
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+
+# Division tables from OpenCV's 8-bit BGR->HSV conversion (RGB2HSV_b, hsv_shift = 12)
+# so the kernels produce exactly the H/S/V values cv2.cvtColor would
+_HSV_SHIFT = 12
+_SDIV_TABLE = np.zeros(256, dtype=np.int32)
+_HDIV_TABLE = np.zeros(256, dtype=np.int32)
+for _i in range(1, 256):
+    _SDIV_TABLE[_i] = int(np.rint((255 << _HSV_SHIFT) / (1.0 * _i)))
+    _HDIV_TABLE[_i] = int(np.rint((180 << _HSV_SHIFT) / (6.0 * _i)))
+del _i
+
+
+def _bgr_window_fish_mask_py(frame, win_lo, win_hi, fish_lo, fish_hi, sdiv, hdiv, fish_mask):
+    """One sweep over a BGR frame: converts each pixel to HSV (OpenCV 8-bit rules), writes the
+    fish range mask (0/255) into fish_mask and returns how many pixels fall in the window range.
+    Channels are tested V, then S, then H: most pixels fail the narrow V ranges, so their S and
+    H (the table lookups and hue branches) are never computed."""
+    rows, cols = frame.shape[0], frame.shape[1]
+    half = 1 << 11  # 1 << (hsv_shift - 1)
+    count = 0
+    for y in range(rows):
+        for x in range(cols):
+            b = int(frame[y, x, 0])
+            g = int(frame[y, x, 1])
+            r = int(frame[y, x, 2])
+            
+            v = max(b, g, r)
+            in_win = win_lo[2] <= v <= win_hi[2]
+            in_fish = fish_lo[2] <= v <= fish_hi[2]
+            if not (in_win or in_fish):
+                fish_mask[y, x] = 0
+                continue
+            
+            diff = v - min(b, g, r)
+            s = (diff * sdiv[v] + half) >> 12
+            in_win = in_win and win_lo[1] <= s <= win_hi[1]
+            in_fish = in_fish and fish_lo[1] <= s <= fish_hi[1]
+            if not (in_win or in_fish):
+                fish_mask[y, x] = 0
+                continue
+            
+            if v == r:
+                h = g - b
+            elif v == g:
+                h = b - r + 2 * diff
+            else:
+                h = r - g + 4 * diff
+            h = (h * hdiv[diff] + half) >> 12
+            if h < 0:
+                h += 180
+            
+            if in_win and win_lo[0] <= h <= win_hi[0]:
+                count += 1
+            if in_fish and fish_lo[0] <= h <= fish_hi[0]:
+                fish_mask[y, x] = 255
+            else:
+                fish_mask[y, x] = 0
+    return count
+
+
+def _count_in_range_py(frame, lo, hi, limit):
+    """Counts the pixels of a 3-channel frame inside [lo, hi] on every channel (what
+    count_nonzero(inRange(...)) gives) without writing a mask. Stops as soon as the count
+    passes limit, so the result is only exact up to limit + 1."""
+    rows, cols = frame.shape[0], frame.shape[1]
+    count = 0
+    for y in range(rows):
+        for x in range(cols):
+            c0 = frame[y, x, 0]
+            if c0 < lo[0] or c0 > hi[0]:
+                continue
+            c1 = frame[y, x, 1]
+            if c1 < lo[1] or c1 > hi[1]:
+                continue
+            c2 = frame[y, x, 2]
+            if c2 < lo[2] or c2 > hi[2]:
+                continue
+            count += 1
+        if count > limit:
+            return count
+    return count
+
+
+# Compiled eagerly (explicit signature) so the first minigame frame doesn't pay for JIT,
+# cached to disk across runs; nogil lets several bot threads run it at once
+_bgr_window_fish_mask = None
+if njit is not None:
+    try:
+        _bgr_window_fish_mask = njit(
+            "int64(uint8[:, :, ::1], uint8[::1], uint8[::1], uint8[::1], uint8[::1], "
+            "int32[::1], int32[::1], uint8[:, ::1])",
+            nogil=True, cache=True
+        )(_bgr_window_fish_mask_py)
+    except Exception:
+        _bgr_window_fish_mask = None
+
+
+def _bgr_window_fish_mask_wrapper(frame, win_lo, win_hi, fish_lo, fish_hi, fish_mask):
+    """Fused BGR->HSV + window count + fish mask. Returns the window pixel count."""
+    return _bgr_window_fish_mask(frame, win_lo, win_hi, fish_lo, fish_hi,
+                                 _SDIV_TABLE, _HDIV_TABLE, fish_mask)
+
+
+bgr_window_fish_mask = _bgr_window_fish_mask_wrapper if _bgr_window_fish_mask is not None else None
+
+count_in_range = None
+if njit is not None:
+    try:
+        count_in_range = njit("int64(uint8[:, :, ::1], uint8[::1], uint8[::1], int64)",
+                              nogil=True, cache=True)(_count_in_range_py)
+    except Exception:
+        count_in_range = None
@@ -4,11 +4,14 @@ Uses computer vision (HSV color detection) for fish and game element detection
 Optimized for maximum performance
 """
 
+import threading
 from typing import Optional, Tuple
 
 import cv2
 import numpy as np
 
+from detector_kernels import bgr_window_fish_mask, count_in_range
+
 
 class FishDetector:
     """Detects fish and game elements using computer vision (HSV color detection)
@@ -17,15 +20,23 @@ class FishDetector:
     # Class-level cached function references for speed
     _cvtColor = cv2.cvtColor
     _inRange = cv2.inRange
-    _countNonZero = cv2.countNonZero
+    _count_nonzero = np.count_nonzero
     _findContours = cv2.findContours
     _boundingRect = cv2.boundingRect
-    _contourArea = cv2.contourArea
     _moments = cv2.moments
     _COLOR_BGR2HSV = cv2.COLOR_BGR2HSV
     _RETR_EXTERNAL = cv2.RETR_EXTERNAL
     _CHAIN_APPROX_SIMPLE = cv2.CHAIN_APPROX_SIMPLE
     
+    # Full-window frames at least this large are thresholded on the GPU via UMat (small regions
+    # aren't worth the upload)
+    _use_opencl = cv2.ocl.haveOpenCL()
+    _OPENCL_MIN_PIXELS = 400 * 400
+    
+    # Mask pixel counting is done in ~64KB strips so positive frames can stop early
+    _STRIP_BYTES = 65536
+    _WINDOW_PIXEL_THRESHOLD = 10000
+    
     def __init__(self):
         # HSV color range for fish (blue-ish) - use dtype for faster comparison
         self.fish_color_lower = np.array([97, 130, 108], dtype=np.uint8)
@@ -34,6 +45,117 @@ class FishDetector:
         # HSV color range for minigame window background (cyan)
         self.window_color_lower = np.array([98, 170, 189], dtype=np.uint8)
         self.window_color_upper = np.array([106, 255, 250], dtype=np.uint8)
+        
+        # Per-thread scratch buffers reused across frames (the debug window also runs
+        # detection on this instance from the Tk thread)
+        self._scratch = threading.local()
+        
+        # HSV conversion, window count and fish mask in one pass over BGR (numba kernel,
+        # falls back to cvtColor + two inRange calls)
+        self.use_fused_masks = bgr_window_fish_mask is not None
+        
+        # BGR gate counted by a numba kernel without writing a mask (falls back to inRange + strip counts)
+        self.use_fused_gate = count_in_range is not None
+        
+        # BGR pre-gate for the window check (skips the HSV pass on idle frames)
+        self.use_bgr_prefilter = True
+        self._window_bgr_gate = self._bgr_gate_bounds(self.window_color_lower, self.window_color_upper)
+    
+    @staticmethod
+    def _bgr_gate_bounds(hsv_lower: np.ndarray, hsv_upper: np.ndarray) -> Optional[Tuple[np.ndarray, np.ndarray]]:
+        """Derives a BGR box containing every pixel that falls inside the given HSV range.
+        Only valid for blue hues (OpenCV H in 91-119) where V == B and R is the minimum channel,
+        so S >= s_lo implies R <= B * (255 - s_lo) / 255. Returns (lower, upper) or None."""
+        h_lo, s_lo, v_lo = (int(c) for c in hsv_lower)
+        h_hi, s_hi, v_hi = (int(c) for c in hsv_upper)
+        if h_lo <= 90 or h_hi >= 120:
+            return None
+        
+        # +0.5 and +1 absorb OpenCV's rounding of S
+        r_hi = min(255, int(v_hi * (255.5 - s_lo) / 255) + 1)
+        lower = np.array([v_lo, 0, 0], dtype=np.uint8)
+        upper = np.array([v_hi, v_hi, r_hi], dtype=np.uint8)
+        return (lower, upper)
+    
+    def _get_buffers(self, height: int, width: int) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Returns this thread's (hsv, mask_a, mask_b) buffers, reallocated only when the frame size changes"""
+        bufs = getattr(self._scratch, 'bufs', None)
+        if bufs is None or bufs[1].shape != (height, width):
+            bufs = (np.empty((height, width, 3), dtype=np.uint8),
+                    np.empty((height, width), dtype=np.uint8),
+                    np.empty((height, width), dtype=np.uint8))
+            self._scratch.bufs = bufs
+        return bufs
+    
+    @staticmethod
+    def _count_exceeds(mask: np.ndarray, threshold: int) -> bool:
+        """Returns True as soon as more than `threshold` mask pixels are non-zero.
+        Scans in row strips with np.count_nonzero and bails out once the threshold is passed."""
+        count_nonzero = FishDetector._count_nonzero
+        height, width = mask.shape[:2]
+        rows = max(1, FishDetector._STRIP_BYTES // max(1, width))
+        count = 0
+        for y in range(0, height, rows):
+            count += count_nonzero(mask[y:y + rows])
+            if count > threshold:
+                return True
+        return False
+    
+    @staticmethod
+    def _shoelace_terms(contours) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """Flattens all contours into one point array and computes the shoelace cross product of
+        every edge (closing edges included). Returns (pts, nxt, cross, starts, sums) where sums
+        holds twice each contour's signed area."""
+        pts = np.concatenate(contours).reshape(-1, 2).astype(np.int64)
+        lengths = np.fromiter((len(c) for c in contours), dtype=np.intp, count=len(contours))
+        starts = np.zeros(len(contours), dtype=np.intp)
+        np.cumsum(lengths[:-1], out=starts[1:])
+        
+        # Index of the next vertex, wrapping each contour's last point back to its first
+        nxt = np.arange(1, len(pts) + 1)
+        nxt[starts + lengths - 1] = starts
+        
+        x = pts[:, 0]
+        y = pts[:, 1]
+        cross = x * y[nxt] - x[nxt] * y
+        sums = np.add.reduceat(cross, starts)
+        return pts, nxt, cross, starts, sums
+    
+    @staticmethod
+    def _largest_contour(contours) -> np.ndarray:
+        """Returns the contour with the largest area (same pick as max(contours, key=contourArea)).
+        All contours are flattened into one point array and scored with a single shoelace pass."""
+        if len(contours) == 1:
+            return contours[0]
+        
+        sums = FishDetector._shoelace_terms(contours)[4]
+        return contours[int(np.abs(sums).argmax())]
+    
+    @staticmethod
+    def _largest_contour_centroid(contours) -> Optional[Tuple[int, int]]:
+        """Centroid of the largest contour, equal to moments' (m10/m00, m01/m00) truncated to int.
+        With several contours it reuses the shoelace terms from the area pass instead of calling
+        cv2.moments; a single contour goes straight to cv2.moments."""
+        if len(contours) == 1:
+            M = FishDetector._moments(contours[0])
+            m00 = M["m00"]
+            if m00 != 0:
+                return (int(M["m10"] / m00), int(M["m01"] / m00))
+            return None
+        
+        pts, nxt, cross, starts, sums = FishDetector._shoelace_terms(contours)
+        idx = int(np.abs(sums).argmax())
+        area2 = int(sums[idx])
+        if area2 == 0:
+            return None
+        
+        # Polygon centroid: sum((p_i + p_next) * cross_i) / (3 * 2A)
+        start = starts[idx]
+        end = starts[idx + 1] if idx + 1 < len(starts) else len(pts)
+        c = cross[start:end]
+        p = pts[start:end] + pts[nxt[start:end]]
+        denom = 3.0 * area2
+        return (int(float((p[:, 0] * c).sum()) / denom), int(float((p[:, 1] * c).sum()) / denom))
     
     def find_fishing_window_bounds(self, frame: np.ndarray) -> Optional[Tuple[int, int, int, int]]:
         """Finds the bounding box of the fishing window. Returns (x, y, width, height) or None."""
@@ -42,16 +164,32 @@ class FishDetector:
         inRange = FishDetector._inRange
         findContours = FishDetector._findContours
         boundingRect = FishDetector._boundingRect
-        contourArea = FishDetector._contourArea
+        largest = FishDetector._largest_contour
         
-        hsv = cvtColor(frame, FishDetector._COLOR_BGR2HSV)
-        mask = inRange(hsv, self.window_color_lower, self.window_color_upper)
+        # Cheap reject on a 2x-decimated frame: a window worth calibrating on is one detection would
+        # call active (> _WINDOW_PIXEL_THRESHOLD pixels, ~1/4 of that after decimation), so if the BGR
+        # gate doesn't reach half of that the full-resolution HSV pass can't find it either
+        gate = self._window_bgr_gate
+        if gate is not None and self.use_bgr_prefilter:
+            small = inRange(frame[::2, ::2], gate[0], gate[1])
+            if not FishDetector._count_exceeds(small, FishDetector._WINDOW_PIXEL_THRESHOLD // 8):
+                return None
+        
+        if FishDetector._use_opencl and frame.shape[0] * frame.shape[1] >= FishDetector._OPENCL_MIN_PIXELS:
+            # Conversion and threshold on the GPU; only the 1-channel mask comes back for findContours
+            uhsv = cvtColor(cv2.UMat(frame), FishDetector._COLOR_BGR2HSV)
+            mask = inRange(uhsv, self.window_color_lower, self.window_color_upper).get()
+        else:
+            # Same per-thread buffers as detect_window_and_fish (polled every 50ms while waiting for the minigame)
+            hsv, mask, _ = self._get_buffers(frame.shape[0], frame.shape[1])
+            cvtColor(frame, FishDetector._COLOR_BGR2HSV, dst=hsv)
+            inRange(hsv, self.window_color_lower, self.window_color_upper, dst=mask)
         contours, _ = findContours(mask, FishDetector._RETR_EXTERNAL, FishDetector._CHAIN_APPROX_SIMPLE)
         
         if not contours:
             return None
         
-        largest_contour = max(contours, key=contourArea)
+        largest_contour = largest(contours)
         x, y, w, h = boundingRect(largest_contour)
         
         if w > 50 and h > 50:
@@ -65,29 +203,44 @@ class FishDetector:
         # Local references for speed (avoid repeated attribute lookups)
         cvtColor = FishDetector._cvtColor
         inRange = FishDetector._inRange
-        countNonZero = FishDetector._countNonZero
+        count_exceeds = FishDetector._count_exceeds
+        threshold = FishDetector._WINDOW_PIXEL_THRESHOLD
         findContours = FishDetector._findContours
-        contourArea = FishDetector._contourArea
-        moments = FishDetector._moments
+        centroid = FishDetector._largest_contour_centroid
+        
+        # Steady state allocates nothing: every intermediate goes into a reused buffer
+        hsv, window_mask, fish_mask = self._get_buffers(frame.shape[0], frame.shape[1])
         
-        hsv = cvtColor(frame, FishDetector._COLOR_BGR2HSV)
+        # Cheap BGR gate: it's a superset of the HSV window mask, so if it can't reach the
+        # threshold the HSV mask can't either and the frame is rejected without conversion
+        gate = self._window_bgr_gate
+        if gate is not None and self.use_bgr_prefilter:
+            if self.use_fused_gate and frame.flags.c_contiguous:
+                if count_in_range(frame, gate[0], gate[1], threshold) <= threshold:
+                    return (False, None)
+            elif not count_exceeds(inRange(frame, gate[0], gate[1], dst=window_mask), threshold):
+                return (False, None)
         
-        # Check window first - early exit if not active
-        window_mask = inRange(hsv, self.window_color_lower, self.window_color_upper)
-        if countNonZero(window_mask) <= 10000:
-            return (False, None)
+        if self.use_fused_masks and frame.flags.c_contiguous:
+            # Fish mask and window pixel count straight from BGR in a single sweep
+            window_pixels = bgr_window_fish_mask(frame, self.window_color_lower, self.window_color_upper,
+                                                 self.fish_color_lower, self.fish_color_upper, fish_mask)
+            if window_pixels <= threshold:
+                return (False, None)
+        else:
+            cvtColor(frame, FishDetector._COLOR_BGR2HSV, dst=hsv)
+            
+            # Check window first - early exit if not active
+            inRange(hsv, self.window_color_lower, self.window_color_upper, dst=window_mask)
+            if not count_exceeds(window_mask, threshold):
+                return (False, None)
+            
+            # Find fish using same HSV
+            inRange(hsv, self.fish_color_lower, self.fish_color_upper, dst=fish_mask)
         
-        # Find fish using same HSV
-        fish_mask = inRange(hsv, self.fish_color_lower, self.fish_color_upper)
         contours, _ = findContours(fish_mask, FishDetector._RETR_EXTERNAL, FishDetector._CHAIN_APPROX_SIMPLE)
         
         if not contours:
             return (True, None)
         
-        largest_contour = max(contours, key=contourArea)
-        M = moments(largest_contour)
-        m00 = M["m00"]
-        if m00 != 0:
-            return (True, (int(M["m10"] / m00), int(M["m01"] / m00)))
-        
-        return (True, None)
+        return (True, centroid(contours))
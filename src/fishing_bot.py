@@ -16,6 +16,8 @@ except Exception:
     pass  # Older Windows versions may not support this
 
 import os
+import queue
+import threading
 import time
 from typing import Optional, Tuple, Dict
 
@@ -30,6 +32,98 @@ pyautogui.FAILSAFE = False
 
 from mss import mss
 
+# Optional DXGI Desktop Duplication capture (Windows); the capture producer falls back to mss without it
+try:
+    import dxcam
+except ImportError:
+    dxcam = None
+
+_dxcam_camera = None  # Shared camera (dxcam keeps one per output), False once creation failed
+_dxcam_lock = threading.Lock()  # Serializes grabs from the bots' capture threads
+
+
+def _get_dxcam_camera():
+    """Returns the shared dxcam camera, creating it on first use. None if dxcam isn't usable."""
+    global _dxcam_camera
+    if dxcam is None:
+        return None
+    with _dxcam_lock:
+        if _dxcam_camera is None:
+            try:
+                _dxcam_camera = dxcam.create(output_color="BGR")
+            except Exception:
+                _dxcam_camera = False
+    return _dxcam_camera or None
+
+# === Direct Win32 mouse input for the minigame click ===
+# Prebuilt SendInput structs skip pyautogui's per-call dispatch; other platforms fall back to pyautogui
+_MOUSEEVENTF_LEFTDOWN = 0x0002
+_MOUSEEVENTF_LEFTUP = 0x0004
+
+
+class _MOUSEINPUT(ctypes.Structure):
+    _fields_ = [("dx", ctypes.c_long), ("dy", ctypes.c_long), ("mouseData", ctypes.c_ulong),
+                ("dwFlags", ctypes.c_ulong), ("time", ctypes.c_ulong), ("dwExtraInfo", ctypes.c_size_t)]
+
+
+class _INPUT(ctypes.Structure):
+    _fields_ = [("type", ctypes.c_ulong), ("mi", _MOUSEINPUT)]  # INPUT_MOUSE; MOUSEINPUT is the largest union member
+
+
+try:
+    _user32 = ctypes.windll.user32
+    _set_cursor_pos = _user32.SetCursorPos
+    _send_input = _user32.SendInput
+    _INPUT_SIZE = ctypes.sizeof(_INPUT)
+    _LEFT_DOWN_INPUT = _INPUT(0, _MOUSEINPUT(0, 0, 0, _MOUSEEVENTF_LEFTDOWN, 0, 0))
+    _LEFT_UP_INPUT = _INPUT(0, _MOUSEINPUT(0, 0, 0, _MOUSEEVENTF_LEFTUP, 0, 0))
+    _LEFT_DOWN = ctypes.byref(_LEFT_DOWN_INPUT)
+    _LEFT_UP = ctypes.byref(_LEFT_UP_INPUT)
+except Exception:
+    _user32 = None
+
+
+def _move_cursor(x: int, y: int):
+    """Moves the cursor to screen coordinates (SetCursorPos, same call pyautogui makes on Windows)"""
+    if _user32 is not None:
+        _set_cursor_pos(int(x), int(y))
+    else:
+        pyautogui.moveTo(x, y, _pause=False)
+
+
+def _left_down():
+    """Presses the left mouse button at the current cursor position"""
+    if _user32 is not None:
+        _send_input(1, _LEFT_DOWN, _INPUT_SIZE)
+    else:
+        pyautogui.mouseDown(_pause=False)
+
+
+def _left_up():
+    """Releases the left mouse button at the current cursor position"""
+    if _user32 is not None:
+        _send_input(1, _LEFT_UP, _INPUT_SIZE)
+    else:
+        pyautogui.mouseUp(_pause=False)
+
+
+# Bot and capture threads run above normal priority so Tk's event loop doesn't add scheduling jitter
+_THREAD_PRIORITY_ABOVE_NORMAL = 1
+
+try:
+    _kernel32 = ctypes.windll.kernel32
+except Exception:
+    _kernel32 = None
+
+
+def _raise_thread_priority():
+    """Raises the calling thread to THREAD_PRIORITY_ABOVE_NORMAL (Windows only, no-op elsewhere)"""
+    if _kernel32 is not None:
+        try:
+            _kernel32.SetThreadPriority(_kernel32.GetCurrentThread(), _THREAD_PRIORITY_ABOVE_NORMAL)
+        except Exception:
+            pass
+
 try:
     from pynput import keyboard
     from pynput.keyboard import Controller, Key
@@ -53,6 +147,9 @@ class FishingBot:
     _template_cache = None
     _template_border_crop = 7  # Pixels to crop from each edge of templates
     _classic_fish_template = None  # Cache for classic fish detection template
+    _classic_scaled_templates = None  # Pre-scaled classic templates: list of (scale, w, h, template)
+    _use_opencl = cv2.ocl.haveOpenCL()  # Run classic template matching on the GPU via UMat
+    _RAND_BUF_SIZE = 4096  # Uniform samples drawn per refill of the sleep jitter buffer
     
     # Color templates for fish that look identical in grayscale
     _confusable_fish = {
@@ -84,12 +181,54 @@ class FishingBot:
         self.bait_counter = bait_counter
         self.bait_keys = bait_keys if bait_keys else ['1', '2', '3', '4']
         self.region_auto_calibrated = False
+        self._classic_last_match = None  # Scaled template entry of the last classic fish detection
         self.consecutive_failures = 0
         self.bot_id = bot_id
         
         # Cached circle values for performance
-        self._circle_center = None
-        self._circle_radius_sq = 67 * 67
+        # Center kept as two plain ints so the hot path does no tuple unpacking
+        self._circle_cx = 0
+        self._circle_cy = 0
+        self._circle_radius = 67
+        self._circle_radius_sq = self._circle_radius * self._circle_radius  # Compared against squared distance, no sqrt
+        self._region_left = 0  # Region offset inside the window, cached with the circle center
+        self._region_top = 0
+        self._update_region_cache()
+        
+        # Preallocated uniform [0, 1) samples for sleep jitter, refilled in bulk on wrap
+        # (kept as a list of Python floats so each draw is plain float math, no numpy scalar)
+        self._rand_buf = np.random.random(self._RAND_BUF_SIZE).tolist()
+        self._rand_idx = 0
+        
+        # Cached window rect for region capture (window moves are rare mid-minigame)
+        self._cached_rect = None
+        self._rect_ts = 0.0
+        self._rect_ttl = 0.5
+        # Reused mss monitor dict for capture_screen (only its fields are patched per frame)
+        self._monitor = {"left": 0, "top": 0, "width": 0, "height": 0}
+        # BGR buffers capture_screen / capture_full_window convert into (callers consume the frame
+        # before the next capture)
+        self._screen_buf = None
+        self._full_buf = None
+        
+        # Double-buffered region capture: a producer thread grabs into the back buffer while
+        # the bot thread runs detection on the front one (phase-1 pre-check only)
+        self._capture_buffers = None
+        self._capture_index = 0  # Index of the front buffer
+        self._capture_lock = threading.Lock()  # Held by the consumer while reading the front buffer
+        self._capture_ready = threading.Event()  # Set when a new front buffer is published
+        self._capture_thread = None
+        self._capture_active = False
+        self._capture_interval = 0.01  # Producer frame budget (~100 fps cap)
+        self.use_dxcam = dxcam is not None  # Producer grabs BGR via DXGI, mss as fallback
+        self._minigame_frame_time = 1.0 / 60  # Loop budget when human-like delays are off
+        
+        # Click worker: the locked re-capture + click runs off the detection loop, so detection
+        # never waits on input_lock or the click's settle sleeps. One pending request is enough
+        # since the worker re-captures before clicking
+        self._click_queue = queue.Queue(maxsize=1)
+        self._click_thread = None
+        self._click_active = False
         
         # Lock fairness: prevent one thread from hogging the lock
         self._consecutive_lock_acquisitions = 0
@@ -279,8 +418,7 @@ class FishingBot:
             }
             
             sct_img = self.sct.grab(monitor)
-            frame = np.array(sct_img)
-            frame = cv2.cvtColor(frame, cv2.COLOR_BGRA2BGR)
+            frame = cv2.cvtColor(np.asarray(sct_img), cv2.COLOR_BGRA2BGR)
             return frame
         except Exception as e:
             if self.on_status_update:
@@ -451,6 +589,26 @@ class FishingBot:
             filename, (inv_x, inv_y) = match
             
             action = fish_actions.get(filename, 'keep')
+            
+            # Validate drop config and report status before taking input_lock, so other bots
+            # never wait on string formatting or GUI callbacks
+            if action == 'drop':
+                drop_pos = self.config.get('drop_button_pos')
+                confirm_pos = self.config.get('confirm_button_pos')
+                if not drop_pos or not confirm_pos:
+                    self._ignored_positions.add((inv_x, inv_y))
+                    if self.on_status_update:
+                        self.on_status_update(f"[W{self.bot_id+1}] Drop positions not configured! Keeping: {filename}")
+                    return
+            
+            if self.on_status_update:
+                item_name = filename.replace('_living.jpg', '').replace('_item.jpg', '')
+                if action == 'keep':
+                    self.on_status_update(f"[W{self.bot_id+1}] Keeping: {item_name} (ignored)")
+                elif action == 'open':
+                    self.on_status_update(f"[W{self.bot_id+1}] Opening: {item_name}")
+                elif action == 'drop':
+                    self.on_status_update(f"[W{self.bot_id+1}] Dropping: {item_name}")
 
             # ========== ACQUIRE LOCK FOR ENTIRE DETECTION + ACTION SEQUENCE ==========
             # This prevents another bot from moving the mouse/clicking between our
@@ -459,14 +617,9 @@ class FishingBot:
                 if action == 'keep':
                     # Item stays in inventory - add to ignore list so we don't process it again
                     self._ignored_positions.add((inv_x, inv_y))
-                    if self.on_status_update:
-                        self.on_status_update(f"[W{self.bot_id+1}] Keeping: {filename.replace('_living.jpg', '').replace('_item.jpg', '')} (ignored)")
                         
                 elif action == 'open':
                     # Right-click to open fish - coordinates already computed, window already active
-                    if self.on_status_update:
-                        self.on_status_update(f"[W{self.bot_id+1}] Opening: {filename.replace('_living.jpg', '').replace('_item.jpg', '')}")
-                    
                     # Convert inventory-relative coords to screen coords
                     win_left, win_top, win_width, _ = self.window_manager.get_window_rect()
                     screen_x = win_left + win_width - self._inventory_width + inv_x
@@ -484,19 +637,7 @@ class FishingBot:
                     pyautogui.moveTo(win_center_x, win_center_y, _pause=False)
                     
                 elif action == 'drop':
-                    # Drop functionality - validate config, do initial right-click test
-                    drop_pos = self.config.get('drop_button_pos')
-                    confirm_pos = self.config.get('confirm_button_pos')
-                    
-                    if not drop_pos or not confirm_pos:
-                        if self.on_status_update:
-                            self.on_status_update(f"[W{self.bot_id+1}] Drop positions not configured! Keeping: {filename}")
-                        self._ignored_positions.add((inv_x, inv_y))
-                        return
-                    
-                    if self.on_status_update:
-                        self.on_status_update(f"[W{self.bot_id+1}] Dropping: {filename.replace('_living.jpg', '').replace('_item.jpg', '')}")
-                    
+                    # Drop positions were validated above - do initial right-click test
                     # Convert inventory-relative coords to screen coords
                     win_left, win_top, win_width, win_height = self.window_manager.get_window_rect()
                     screen_x = win_left + win_width - self._inventory_width + inv_x
@@ -546,40 +687,40 @@ class FishingBot:
                         # ========== DROP SEQUENCE ==========
                         # Step 1: Left-click on the item to pick it up
                         pyautogui.moveTo(screen_x, screen_y, _pause=False)
-                        time.sleep(np.random.uniform(0.05, 0.07))
+                        time.sleep(self._rand_uniform(0.05, 0.07))
                         pyautogui.click(_pause=False)
-                        time.sleep(np.random.uniform(0.1, 0.15))
+                        time.sleep(self._rand_uniform(0.1, 0.15))
                         
                         # Step 2: Move cursor to middle of window
                         win_center_x = win_left + win_width // 2
                         win_center_y = win_top + win_height // 2
                         pyautogui.moveTo(win_center_x, win_center_y, _pause=False)
-                        time.sleep(np.random.uniform(0.05, 0.07))
+                        time.sleep(self._rand_uniform(0.05, 0.07))
                         
                         # Step 3: Left-click to drop the item
                         pyautogui.click(_pause=False)
-                        time.sleep(np.random.uniform(0.1, 0.15))
+                        time.sleep(self._rand_uniform(0.1, 0.15))
                         
                         # Step 4: Click the drop button (relative to window)
                         drop_screen_x = win_left + drop_pos[0]
                         drop_screen_y = win_top + drop_pos[1]
                         pyautogui.moveTo(drop_screen_x, drop_screen_y, _pause=False)
-                        time.sleep(np.random.uniform(0.05, 0.07))
+                        time.sleep(self._rand_uniform(0.05, 0.07))
                         pyautogui.click(_pause=False)
-                        time.sleep(np.random.uniform(0.1, 0.15))
+                        time.sleep(self._rand_uniform(0.1, 0.15))
                         
                         # Step 5: Click the confirm button (relative to window)
                         confirm_screen_x = win_left + confirm_pos[0]
                         confirm_screen_y = win_top + confirm_pos[1]
                         pyautogui.moveTo(confirm_screen_x, confirm_screen_y, _pause=False)
-                        time.sleep(np.random.uniform(0.05, 0.07))
+                        time.sleep(self._rand_uniform(0.05, 0.07))
                         pyautogui.click(_pause=False)
-                        time.sleep(np.random.uniform(0.1, 0.15))
+                        time.sleep(self._rand_uniform(0.1, 0.15))
                         
                         # Move cursor to safe position (last mouse op before releasing lock)
                         pyautogui.moveTo(win_center_x, win_center_y, _pause=False)
                     # ========== DROP LOCK RELEASED ==========
-                    time.sleep(np.random.uniform(0.1, 0.15))  # Final settle outside lock
+                    time.sleep(self._rand_uniform(0.1, 0.15))  # Final settle outside lock
             
             elif action == 'open':
                 time.sleep(0.1)  # Wait for right click to register
@@ -605,9 +746,15 @@ class FishingBot:
     def _update_region_cache(self):
         """Updates cached constants when region changes."""
         if self.region:
-            self._circle_center = (self.region.width >> 1, self.region.height >> 1)  # Bitwise divide by 2
+            self._circle_cx = self.region.width >> 1  # Bitwise divide by 2
+            self._circle_cy = self.region.height >> 1
+            self._region_left = self.region.left
+            self._region_top = self.region.top
         else:
-            self._circle_center = None
+            self._circle_cx = 0
+            self._circle_cy = 0
+            self._region_left = 0
+            self._region_top = 0
     
     def capture_full_window(self) -> np.ndarray:
         """Captures the entire game window for initial detection."""
@@ -625,8 +772,12 @@ class FishingBot:
             }
             
             sct_img = self.sct.grab(monitor)
-            frame = np.array(sct_img)
-            frame = cv2.cvtColor(frame, cv2.COLOR_BGRA2BGR)
+            bgra = np.asarray(sct_img)
+            buf = self._full_buf
+            if buf is None or buf.shape[:2] != bgra.shape[:2]:
+                buf = np.empty(bgra.shape[:2] + (3,), dtype=np.uint8)
+                self._full_buf = buf
+            frame = cv2.cvtColor(bgra, cv2.COLOR_BGRA2BGR, dst=buf)
             
             return frame
         except Exception as e:
@@ -634,6 +785,25 @@ class FishingBot:
                 self.on_status_update(f"Screenshot error: {e}")
             return np.zeros((100, 100, 3), dtype=np.uint8)
     
+    def _rand_uniform(self, low: float, high: float) -> float:
+        """Drop-in for np.random.uniform(low, high) drawing from the preallocated sample buffer"""
+        idx = self._rand_idx
+        if idx == self._RAND_BUF_SIZE:
+            self._rand_buf = np.random.random(self._RAND_BUF_SIZE).tolist()
+            idx = 0
+        self._rand_idx = idx + 1
+        return low + (high - low) * self._rand_buf[idx]
+    
+    def _get_cached_window_rect(self) -> Tuple[int, int, int, int]:
+        """Returns the window rect, re-reading it from the window at most every _rect_ttl seconds"""
+        now = time.monotonic()
+        rect = self._cached_rect
+        if rect is None or now - self._rect_ts > self._rect_ttl:
+            rect = self.window_manager.get_window_rect()
+            self._cached_rect = rect
+            self._rect_ts = now
+        return rect
+    
     def capture_screen(self) -> np.ndarray:
         """Captures the game region as a numpy array for processing."""
         try:
@@ -643,20 +813,21 @@ class FishingBot:
             if not self.region:
                 return self.capture_full_window()
             
-            win_left, win_top, _, _ = self.window_manager.get_window_rect()
-            screen_left = win_left + self.region.left
-            screen_top = win_top + self.region.top
+            win_left, win_top, _, _ = self._get_cached_window_rect()
+            region = self.region
+            monitor = self._monitor
+            monitor["left"] = win_left + region.left
+            monitor["top"] = win_top + region.top
+            monitor["width"] = region.width
+            monitor["height"] = region.height
             
-            monitor = {
-                "left": screen_left,
-                "top": screen_top,
-                "width": self.region.width,
-                "height": self.region.height
-            }
+            buf = self._screen_buf
+            if buf is None or buf.shape[0] != region.height or buf.shape[1] != region.width:
+                buf = np.empty((region.height, region.width, 3), dtype=np.uint8)
+                self._screen_buf = buf
             
             sct_img = self.sct.grab(monitor)
-            frame = np.array(sct_img)
-            frame = cv2.cvtColor(frame, cv2.COLOR_BGRA2BGR)
+            frame = cv2.cvtColor(np.asarray(sct_img), cv2.COLOR_BGRA2BGR, dst=buf)
             
             return frame
         except Exception as e:
@@ -666,21 +837,171 @@ class FishingBot:
                 return np.zeros((self.region.height, self.region.width, 3), dtype=np.uint8)
             return np.zeros((100, 100, 3), dtype=np.uint8)
     
+    def _start_capture_pipeline(self):
+        """Starts the capture producer thread for the calibrated region."""
+        if self._capture_active or not self.region:
+            return
+        shape = (self.region.height, self.region.width, 3)
+        if self._capture_buffers is None or self._capture_buffers[0].shape != shape:
+            self._capture_buffers = [np.empty(shape, dtype=np.uint8), np.empty(shape, dtype=np.uint8)]
+        self._capture_ready.clear()
+        self._capture_active = True
+        self._capture_thread = threading.Thread(target=self._capture_worker, daemon=True,
+                                                name=f"Capture-W{self.bot_id+1}")
+        self._capture_thread.start()
+    
+    def _stop_capture_pipeline(self):
+        """Stops the capture producer thread and waits briefly for it to exit."""
+        self._capture_active = False
+        thread = self._capture_thread
+        self._capture_thread = None
+        if thread and thread is not threading.current_thread():
+            thread.join(timeout=0.5)
+        self._capture_ready.clear()
+    
+    def _capture_worker(self):
+        """Producer loop: grabs the region into the back buffer, then swaps it to the front.
+        Uses its own mss instance since mss handles are not shared across threads."""
+        _raise_thread_priority()
+        sct = None
+        try:
+            sct = mss()
+            camera = _get_dxcam_camera() if self.use_dxcam else None
+            buffers = self._capture_buffers
+            height, width = buffers[0].shape[:2]
+            monitor = {"left": 0, "top": 0, "width": width, "height": height}
+            while self._capture_active and self.running:
+                if self.paused:
+                    time.sleep(0.1)
+                    continue
+                
+                frame_start = time.perf_counter()
+                win_left, win_top, _, _ = self._get_cached_window_rect()
+                monitor["left"] = win_left + self.region.left
+                monitor["top"] = win_top + self.region.top
+                
+                # Only the producer changes _capture_index, so the back buffer is never
+                # the one the consumer is reading under _capture_lock
+                back = buffers[self._capture_index ^ 1]
+                grabbed = None
+                if camera is not None:
+                    # DXGI hands back BGR directly; None means no new desktop frame since the
+                    # last grab (possibly another bot's), so that tick goes through mss
+                    try:
+                        with _dxcam_lock:
+                            grabbed = camera.grab(region=(monitor["left"], monitor["top"],
+                                                          monitor["left"] + width, monitor["top"] + height))
+                        if grabbed is not None:
+                            np.copyto(back, grabbed)
+                    except Exception:
+                        camera = None  # Region off the duplicated output etc. - stay on mss
+                        grabbed = None
+                if grabbed is None:
+                    # The grab is read through a view (np.asarray), cvtColor makes the only copy
+                    cv2.cvtColor(np.asarray(sct.grab(monitor)), cv2.COLOR_BGRA2BGR, dst=back)
+                with self._capture_lock:
+                    self._capture_index ^= 1
+                self._capture_ready.set()
+                
+                # Sleep only what's left of the frame budget after the grab
+                remaining = self._capture_interval - (time.perf_counter() - frame_start)
+                if remaining > 0:
+                    time.sleep(remaining)
+        except Exception as e:
+            if self.on_status_update:
+                self.on_status_update(f"[W{self.bot_id+1}] Capture pipeline error: {e}")
+        finally:
+            self._capture_active = False
+            if sct is not None:
+                try:
+                    sct.close()
+                except Exception:
+                    pass
+    
+    def _start_click_worker(self):
+        """Starts the click worker thread for the calibrated region."""
+        if self._click_active or not self.region:
+            return
+        try:
+            self._click_queue.get_nowait()  # Drop a request left over from the last minigame
+        except queue.Empty:
+            pass
+        self._click_active = True
+        self._click_thread = threading.Thread(target=self._click_worker, daemon=True,
+                                              name=f"Click-W{self.bot_id+1}")
+        self._click_thread.start()
+    
+    def _stop_click_worker(self):
+        """Stops the click worker thread and waits briefly for it to exit."""
+        self._click_active = False
+        thread = self._click_thread
+        self._click_thread = None
+        if thread and thread is not threading.current_thread():
+            thread.join(timeout=0.5)
+    
+    def _click_worker(self):
+        """Consumer loop: waits for click requests from the detection loop and runs the locked
+        re-capture + click. Uses its own mss instance since mss handles are not shared across threads."""
+        _raise_thread_priority()
+        sct = None
+        try:
+            sct = mss()
+            region = self.region
+            monitor = {"left": 0, "top": 0, "width": region.width, "height": region.height}
+            buf = np.empty((region.height, region.width, 3), dtype=np.uint8)
+            
+            def capture() -> np.ndarray:
+                win_left, win_top, _, _ = self._get_cached_window_rect()
+                monitor["left"] = win_left + region.left
+                monitor["top"] = win_top + region.top
+                return cv2.cvtColor(np.asarray(sct.grab(monitor)), cv2.COLOR_BGRA2BGR, dst=buf)
+            
+            while self._click_active and self.running:
+                try:
+                    self._click_queue.get(timeout=0.1)
+                except queue.Empty:
+                    continue
+                if self.paused:
+                    continue
+                
+                try:
+                    _, fish_pos = self._click_if_in_circle(capture)
+                    if fish_pos:
+                        self.hits += 1
+                except Exception as e:
+                    if self.on_status_update:
+                        self.on_status_update(f"[W{self.bot_id+1}] Click error: {e}")
+        except Exception as e:
+            if self.on_status_update:
+                self.on_status_update(f"[W{self.bot_id+1}] Click worker error: {e}")
+        finally:
+            self._click_active = False
+            if sct is not None:
+                try:
+                    sct.close()
+                except Exception:
+                    pass
+    
     def atomic_capture_and_click(self) -> Tuple[bool, Optional[Tuple[int, int]]]:
         """Captures screen and clicks fish if in circle. Optimized single-pass detection.
         Returns: (minigame_active, fish_position_clicked or None)"""
         # Local references for speed
         capture = self.capture_screen
         detect = self.detector.detect_window_and_fish
-        circle_center = self._circle_center
+        cx = self._circle_cx
+        cy = self._circle_cy
         radius_sq = self._circle_radius_sq
-        region_left = self.region.left
-        region_top = self.region.top
         
         try:
             # ========== PHASE 1: Quick pre-check (NO LOCK) ==========
-            frame = capture()
-            window_active, fish_pos = detect(frame)
+            # Use the pipelined frame when the producer has one ready, else capture directly
+            if self._capture_active and self._capture_ready.wait(0.05):
+                self._capture_ready.clear()
+                with self._capture_lock:
+                    window_active, fish_pos = detect(self._capture_buffers[self._capture_index])
+            else:
+                frame = capture()
+                window_active, fish_pos = detect(frame)
             
             if not window_active:
                 return (False, None)
@@ -689,66 +1010,87 @@ class FishingBot:
             
             # Inline circle check for speed
             fx, fy = fish_pos
-            cx, cy = circle_center
             dx, dy = fx - cx, fy - cy
             if (dx * dx + dy * dy) >= radius_sq:
                 # Fish not in circle - reset consecutive lock counter
                 self._consecutive_lock_acquisitions = 0
                 return (True, None)
             
-            # Fish is in circle! Now get lock and click
-            # ========== PHASE 2: Fresh capture + click (WITH LOCK) ==========
-            with input_lock:
-                # Activate window
-                self.window_manager.activate_window(force_activate=True)
-                
-                # RE-CAPTURE fresh frame
-                frame = capture()
-                window_active, fish_pos = detect(frame)
-                
-                if not window_active:
-                    self._consecutive_lock_acquisitions = 0
-                    return (False, None)
-                if not fish_pos:
-                    self._consecutive_lock_acquisitions = 0
-                    return (True, None)
-                
-                # Inline circle check
-                fx, fy = fish_pos
-                dx, dy = fx - cx, fy - cy
-                if (dx * dx + dy * dy) >= radius_sq:
-                    self._consecutive_lock_acquisitions = 0
-                    return (True, None)
-                
-                # Click at FRESH position
-                win_left, win_top, _, _ = self.window_manager.get_window_rect()
-                screen_x = win_left + region_left + fx
-                screen_y = win_top + region_top + fy
-                
-                # Optimized click sequence
-                pyautogui.moveTo(screen_x, screen_y, _pause=False)
-                time.sleep(0.012)  # Slightly reduced settle time
-                pyautogui.mouseDown(_pause=False)
-                time.sleep(0.008)  # Minimal down time
-                pyautogui.mouseUp(_pause=False)
-                time.sleep(0.035)  # Post-click settle
-                
-                # Increment consecutive lock acquisition counter
-                self._consecutive_lock_acquisitions += 1
-            # ========== LOCK RELEASED ==========
-            
-            # Fairness: yield to other threads if this thread has been acquiring lock too often
-            if self._consecutive_lock_acquisitions >= self._lock_acquisition_limit:
-                self._consecutive_lock_acquisitions = 0
-                time.sleep(0.05)  # 50ms yield to allow other threads to compete for lock
+            # Fish is in circle! Hand the click to the worker when it's running
+            if self._click_active:
+                try:
+                    self._click_queue.put_nowait(fish_pos)
+                except queue.Full:
+                    pass  # A click is already pending, it re-captures anyway
+                return (True, None)
             
-            return (True, fish_pos)
+            return self._click_if_in_circle(capture)
             
         except Exception as e:
             if self.on_status_update:
                 self.on_status_update(f"[W{self.bot_id+1}] Click error: {e}")
             return (True, None)
     
+    def _click_if_in_circle(self, capture) -> Tuple[bool, Optional[Tuple[int, int]]]:
+        """Phase 2 of the click: under input_lock, re-captures with `capture` and clicks the fish
+        if it is still in the circle. Returns: (minigame_active, fish_position_clicked or None)"""
+        detect = self.detector.detect_window_and_fish
+        cx = self._circle_cx
+        cy = self._circle_cy
+        radius_sq = self._circle_radius_sq
+        region_left = self._region_left
+        region_top = self._region_top
+        
+        # ========== PHASE 2: Fresh capture + click (WITH LOCK) ==========
+        with input_lock:
+            # Activate window
+            self.window_manager.activate_window(force_activate=True)
+            
+            # RE-CAPTURE fresh frame
+            frame = capture()
+            window_active, fish_pos = detect(frame)
+            
+            if not window_active:
+                self._consecutive_lock_acquisitions = 0
+                return (False, None)
+            if not fish_pos:
+                self._consecutive_lock_acquisitions = 0
+                return (True, None)
+            
+            # Inline circle check
+            fx, fy = fish_pos
+            dx, dy = fx - cx, fy - cy
+            if (dx * dx + dy * dy) >= radius_sq:
+                self._consecutive_lock_acquisitions = 0
+                return (True, None)
+            
+            # Click at FRESH position (also refreshes the cached rect used by capture)
+            rect = self.window_manager.get_window_rect()
+            self._cached_rect = rect
+            self._rect_ts = time.monotonic()
+            win_left, win_top, _, _ = rect
+            screen_x = win_left + region_left + fx
+            screen_y = win_top + region_top + fy
+            
+            # Optimized click sequence
+            _move_cursor(screen_x, screen_y)
+            time.sleep(0.012)  # Slightly reduced settle time
+            _left_down()
+            time.sleep(0.008)  # Minimal down time
+            _left_up()
+            time.sleep(0.035)  # Post-click settle
+            
+            # Increment consecutive lock acquisition counter
+            self._consecutive_lock_acquisitions += 1
+        # ========== LOCK RELEASED ==========
+        
+        # Fairness: yield to other threads if this thread has been acquiring lock too often
+        if self._consecutive_lock_acquisitions >= self._lock_acquisition_limit:
+            self._consecutive_lock_acquisitions = 0
+            time.sleep(0.05)  # 50ms yield to allow other threads to compete for lock
+        
+        return (True, fish_pos)
+    
     def get_bait_key(self, bait_count: int) -> str:
         """Determines which keyboard key to press based on bait counter and selected keys."""
         if not self.bait_keys:
@@ -855,9 +1197,9 @@ class FishingBot:
                 # Right-click on armor slot
                 pyautogui.moveTo(screen_x, screen_y, _pause=False)
                 time.sleep(0.1)
-                time.sleep(np.random.uniform(0.1, 0.15))
+                time.sleep(self._rand_uniform(0.1, 0.15))
                 pyautogui.click(button='right', _pause=False)
-                time.sleep(np.random.uniform(0.05, 0.07))  # Wait for armor equip/unequip animation
+                time.sleep(self._rand_uniform(0.05, 0.07))  # Wait for armor equip/unequip animation
     
     def press_key(self, key: str, description: str = ""):
         """Presses a keyboard key using pynput. Uses input lock for thread safety."""
@@ -881,12 +1223,14 @@ class FishingBot:
                 self.keyboard_controller.press(pynput_key)
                 time.sleep(0.025)
                 self.keyboard_controller.release(pynput_key)
-                
-                if description and self.on_status_update:
-                    self.on_status_update(f"[W{self.bot_id+1}] {description}")
             except Exception as e:
                 if self.on_status_update:
                     self.on_status_update(f"[W{self.bot_id+1}] Error pressing key '{key}': {e}")
+                return
+        
+        # Reported after the lock is released
+        if description and self.on_status_update:
+            self.on_status_update(f"[W{self.bot_id+1}] {description}")
     
     def wait_for_minigame_window(self, timeout: float = 4.0) -> bool:
         """Waits for and finds the fishing minigame window. Auto-calibrates region on first detection.
@@ -1035,6 +1379,29 @@ class FishingBot:
         
         return FishingBot._classic_fish_template
     
+    def _get_classic_scaled_templates(self, template: np.ndarray) -> list:
+        """Returns the classic template resized to every detection scale (built once, shared).
+        Templates are uploaded as UMat when OpenCL is available so matching runs on the GPU."""
+        if FishingBot._classic_scaled_templates is not None:
+            return FishingBot._classic_scaled_templates
+        
+        # Multi-scale detection: scales from 25% to 300% of original template size
+        scales = [0.25, 0.3, 0.35, 0.4, 0.45, 0.5, 0.6, 0.7, 0.8, 0.9, 1.0, 1.2, 1.4, 1.6, 1.8, 2.0, 2.25, 2.5, 2.75, 3.0]
+        t_h, t_w = template.shape
+        scaled = []
+        for scale in scales:
+            new_w = int(t_w * scale)
+            new_h = int(t_h * scale)
+            if new_w < 10 or new_h < 10:
+                continue
+            resized = cv2.resize(template, (new_w, new_h), interpolation=cv2.INTER_AREA if scale < 1 else cv2.INTER_LINEAR)
+            if FishingBot._use_opencl:
+                resized = cv2.UMat(resized)
+            scaled.append((scale, new_w, new_h, resized))
+        
+        FishingBot._classic_scaled_templates = scaled
+        return scaled
+    
     def wait_for_classic_fish(self, timeout: float = 10.0) -> bool:
         """Waits for the classic fish image to appear in the game window.
         Returns True if found, False if timeout."""
@@ -1045,10 +1412,12 @@ class FishingBot:
             return True  # Fallback: proceed anyway
         
         start_time = time.time()
-        t_h, t_w = template.shape
+        scaled_templates = self._get_classic_scaled_templates(template)
+        use_opencl = FishingBot._use_opencl
         
-        # Multi-scale detection: check scales from 25% to 300% of original template size
-        scales = [0.25, 0.3, 0.35, 0.4, 0.45, 0.5, 0.6, 0.7, 0.8, 0.9, 1.0, 1.2, 1.4, 1.6, 1.8, 2.0, 2.25, 2.5, 2.75, 3.0]
+        # Adaptive sweep: after 30 frames without a near match, only the scale of the last
+        # detection is checked, with a full multi-scale sweep every 10th frame
+        idle_frames = 0
         
         while self.running and time.time() - start_time < timeout:
             if self.paused:
@@ -1068,22 +1437,27 @@ class FishingBot:
                 frame_gray = frame_gray[:crop_bottom, crop_left:crop_right]
                 
                 f_h, f_w = frame_gray.shape
+                if use_opencl:
+                    # Upload the cropped bar once; every scale matches against it on the GPU
+                    frame_gray = cv2.UMat(np.ascontiguousarray(frame_gray))
                 
                 # Multi-scale template matching
                 best_match_val = 0
                 best_scale = 1.0
+                best_entry = None
                 
-                for scale in scales:
-                    # Resize template to current scale
-                    new_w = int(t_w * scale)
-                    new_h = int(t_h * scale)
-                    
-                    # Skip if scaled template is larger than frame or too small
-                    if new_h > f_h or new_w > f_w or new_w < 10 or new_h < 10:
+                last_match = self._classic_last_match
+                if last_match is not None and idle_frames > 30 and idle_frames % 10:
+                    candidates = (last_match,)
+                else:
+                    candidates = scaled_templates
+                
+                for entry in candidates:
+                    scale, new_w, new_h, scaled_template = entry
+                    # Skip if scaled template is larger than frame
+                    if new_h > f_h or new_w > f_w:
                         continue
                     
-                    scaled_template = cv2.resize(template, (new_w, new_h), interpolation=cv2.INTER_AREA if scale < 1 else cv2.INTER_LINEAR)
-                    
                     # Template matching
                     result = cv2.matchTemplate(frame_gray, scaled_template, cv2.TM_CCOEFF_NORMED)
                     _, max_val, _, _ = cv2.minMaxLoc(result)
@@ -1091,12 +1465,14 @@ class FishingBot:
                     if max_val > best_match_val:
                         best_match_val = max_val
                         best_scale = scale
+                        best_entry = entry
                     
                     # Early exit if we found a very good match
                     if max_val >= 0.8:
                         break
                 
                 if best_match_val >= 0.7:  # Found the classic fish indicator
+                    self._classic_last_match = best_entry
                     # Start timer IMMEDIATELY after detection (configurable delay)
                     delay = self.config.get('classic_fishing_delay', 3.0)
                     # Use interruptible sleep that checks running/paused state
@@ -1113,6 +1489,8 @@ class FishingBot:
                         self.on_status_update(f"[W{self.bot_id+1}] Classic fish detected (confidence: {best_match_val:.2f}, scale: {best_scale:.1f}x, delay: {delay}s)")
                     return True
                 
+                # Near matches switch back to full multi-scale sweeps
+                idle_frames = 0 if best_match_val >= 0.5 else idle_frames + 1
                 time.sleep(0.02)  # Fast polling
             except Exception as e:
                 if self.on_status_update:
@@ -1125,6 +1503,8 @@ class FishingBot:
     
     def play_game(self):
         """Main game loop implementing the fishing minigame workflow."""
+        _raise_thread_priority()
+        
         # Reset bait if starting with 0 or negative bait
         max_bait = len(self.bait_keys) * 200
         if self.bait_counter <= 0:
@@ -1147,7 +1527,8 @@ class FishingBot:
             
             try:
                 bait_key = self.get_bait_key(self.bait_counter)
-                self.press_key(bait_key, f"Pressed key {bait_key}")
+                # Description is only formatted when a status listener is attached
+                self.press_key(bait_key, f"Pressed key {bait_key}" if self.on_status_update else None)
                 time.sleep(0.05)
                 
                 self.press_key('space', "Cast fishing line")
@@ -1186,6 +1567,11 @@ class FishingBot:
                     minigame_active = True
                     human_like = self.config.get('human_like_clicking', True)
                     
+                    # Capture runs ahead and clicks are issued on their own threads for the duration of the minigame
+                    self._start_capture_pipeline()
+                    self._start_click_worker()
+                    
+                    frame_time = self._minigame_frame_time
                     while self.running and minigame_active:
                         if self.paused:
                             time.sleep(0.1)
@@ -1193,7 +1579,9 @@ class FishingBot:
                         
                         # Small delay between attempts (minimized for responsiveness)
                         if human_like:
-                            time.sleep(np.random.uniform(0.15, 0.4))
+                            time.sleep(self._rand_uniform(0.15, 0.4))
+                        else:
+                            iteration_start = time.perf_counter()
                         
                         try:
                             # Atomic operation: capture + detect + click all within lock
@@ -1217,21 +1605,28 @@ class FishingBot:
                                 break
                             
                             if fish_pos:
+                                # Hits aren't shown in the GUI; stats are pushed once per finished game
                                 self.hits += 1
-                                if self.on_stats_update:
-                                    self.on_stats_update(self.bot_id, self.hits, self.total_games, self.bait_counter)
                                 
                         except Exception as e:
                             if self.on_status_update:
                                 self.on_status_update(f"[W{self.bot_id+1}] Error: {e}")
+                        
+                        # Frame limiter: sleep only what's left of the budget after detection + click
+                        if not human_like:
+                            remaining = frame_time - (time.perf_counter() - iteration_start)
+                            if remaining > 0:
+                                time.sleep(remaining)
                     
+                    self._stop_click_worker()
+                    self._stop_capture_pipeline()
                     self.hits = 0
                     if self.bait_counter > 0:
                         if self.config.get('quick_skip', False):
                             self.quickskip()
                         else:
                             # Interruptible wait that respects pause state
-                            wait_time = np.random.uniform(4, 4.5)
+                            wait_time = self._rand_uniform(4, 4.5)
                             wait_end = time.time() + wait_time
                             while time.time() < wait_end and self.running:
                                 if self.paused:
@@ -1322,7 +1717,7 @@ class FishingBot:
                             self.quickskip()
                         else:
                             # Interruptible random wait
-                            wait_time = np.random.uniform(4, 4.5)
+                            wait_time = self._rand_uniform(4, 4.5)
                             wait_end = time.time() + wait_time
                             while time.time() < wait_end and self.running:
                                 if self.paused:
@@ -2,6 +2,7 @@
 Window Manager and Game Region classes for the Fishing Bot
 """
 
+import ctypes
 import time
 from dataclasses import dataclass
 from typing import List, Tuple
@@ -10,36 +11,103 @@ import pygetwindow as gw
 from utils import DEBUG_PRINTS
 
 
+try:
+    _user32 = ctypes.windll.user32
+    _WNDENUMPROC = ctypes.WINFUNCTYPE(ctypes.c_bool, ctypes.c_void_p, ctypes.c_void_p)
+except Exception:
+    _user32 = None
+
+
+def _enum_visible_titled_windows() -> List[Tuple[int, str]]:
+    """Single EnumWindows pass returning (hwnd, title) for visible top-level windows with a title.
+    Hidden and untitled handles are dropped inside the callback, before any Win32Window is built."""
+    found = []
+    is_visible = _user32.IsWindowVisible
+    text_length = _user32.GetWindowTextLengthW
+    get_text = _user32.GetWindowTextW
+    
+    def callback(hwnd, _):
+        if is_visible(hwnd):
+            length = text_length(hwnd)
+            if length > 0:
+                buf = ctypes.create_unicode_buffer(length + 1)
+                get_text(hwnd, buf, length + 1)
+                found.append((hwnd, buf.value))
+        return True
+    
+    _user32.EnumWindows(_WNDENUMPROC(callback), None)
+    return found
+
+
 class WindowManager:
     """Manages window detection and focus for the bot"""
     
+    # Short-lived cache for get_all_windows (the GUI queries it from several handlers in a row)
+    _windows_cache = None
+    _windows_cache_ts = 0.0
+    _WINDOWS_CACHE_TTL = 1.0
+    
     def __init__(self):
         self.selected_window = None
     
     @staticmethod
-    def get_all_windows() -> List[Tuple[str, gw.Win32Window]]:
-        """Gets all visible windows on Windows 10+. Returns list of (display_name, window)"""
+    def is_window_alive(window) -> bool:
+        """True if the window's handle still refers to an existing window (one IsWindow call).
+        Without user32 the handle can't be checked and is assumed valid."""
+        if _user32 is None:
+            return True
+        try:
+            return bool(_user32.IsWindow(window._hWnd))
+        except Exception:
+            return False
+    
+    @staticmethod
+    def get_all_windows(force_refresh: bool = False) -> List[Tuple[str, gw.Win32Window]]:
+        """Gets all visible windows on Windows 10+. Returns list of (display_name, window)
+        Results are cached for _WINDOWS_CACHE_TTL seconds unless force_refresh is set."""
+        now = time.monotonic()
+        cached = WindowManager._windows_cache
+        if not force_refresh and cached is not None and now - WindowManager._windows_cache_ts < WindowManager._WINDOWS_CACHE_TTL:
+            return list(cached)
+        
         windows = []
         priority_windows = []  # Windows with 'mt2', 'metin2', 'metin 2', or words with '2'
         
         try:
-            # Use getAllWindows() directly - more reliable on Windows 10 than iterating processes
-            all_wins = gw.getAllWindows()
+            if _user32 is not None:
+                # (hwnd, title) pairs from one EnumWindows pass; visibility and title are already checked
+                entries = [(gw.Win32Window(hwnd), title) for hwnd, title in _enum_visible_titled_windows()]
+            else:
+                # Use getAllWindows() directly - more reliable on Windows 10 than iterating processes
+                entries = []
+                for win in gw.getAllWindows():
+                    try:
+                        # Check if window is visible first (use 'visible' property, not 'isVisible') -
+                        # most enumerated windows are hidden, so their titles are never read
+                        if getattr(win, 'visible', True):
+                            # Every .title access is a GetWindowText round trip, so read it once
+                            entries.append((win, win.title))
+                    except Exception:
+                        pass
             
-            for win in all_wins:
+            seen_handles = set()
+            
+            for win, title in entries:
                 try:
-                    # Skip empty titles
-                    if not win.title or not win.title.strip():
+                    # Skip handles already listed
+                    hwnd = win._hWnd
+                    if hwnd in seen_handles:
                         continue
+                    seen_handles.add(hwnd)
                     
-                    # Check if window is visible (use 'visible' property, not 'isVisible')
-                    if not getattr(win, 'visible', True):
+                    # Skip empty titles
+                    if not title or not title.strip():
                         continue
                     
-                    display_name = win.title
+                    display_name = title
                     
                     # Check if window matches Metin2 patterns (prioritize these)
-                    title_lower = win.title.lower()
+                    title_lower = title.lower()
                     if any(pattern in title_lower for pattern in ['mt2', 'metin2', 'metin 2']) or \
                        any(word.endswith('2') for word in title_lower.split()):
                         priority_windows.append((display_name, win))
@@ -72,7 +140,9 @@ class WindowManager:
                 final_name = display_name
             result.append((final_name, win))
         
-        return result
+        WindowManager._windows_cache = result
+        WindowManager._windows_cache_ts = now
+        return list(result)
     
     def activate_window(self, force_activate: bool = False):
         """Activates and brings the selected window to focus"""
@@ -110,6 +180,15 @@ class WindowManager:
             if DEBUG_PRINTS:
                 print(f"Error activating window: {e}")
     
+    def is_minimized(self) -> bool:
+        """True if the selected window is minimized (nothing useful to capture)"""
+        if not self.selected_window:
+            return False
+        try:
+            return bool(self.selected_window.isMinimized)
+        except Exception:
+            return False
+    
     def get_window_rect(self) -> Tuple[int, int, int, int]:
         """Gets the selected window's position and size (left, top, width, height)"""
         if not self.selected_window: